@@ -49,7 +49,7 @@ class FavoritesGrid:
             # Load and process logo
             logo_path = os.path.join(AppConfig.CACHE_DIR, f"{coin['symbol'].lower()}_logo.png")
             if os.path.exists(logo_path):
-                logo = pygame.image.load(logo_path)
+                logo = pygame.image.load(logo_path).convert_alpha()
                 logo = pygame.transform.scale(logo, (self.logo_size, self.logo_size))
                 
                 # Get dominant color from logo
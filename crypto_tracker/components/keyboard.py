@@ -1,4 +1,5 @@
 import pygame
+from typing import Optional
 from ..config.settings import AppConfig
 from ..utils.logger import get_logger
 
@@ -21,6 +22,11 @@ class VirtualKeyboard:
             ['Z', 'X', 'C', 'V', 'B', 'N', 'M', 'DEL']
         ]
         
+        # Keys with their own action, any other key is typed
+        self.special_keys = {
+            'DEL': self._delete_last
+        }
+        
         # Calculate dimensions
         self.width = surface.get_width()
         self.height = surface.get_height()
@@ -40,6 +46,11 @@ class VirtualKeyboard:
         self.key_width = (self.width - (key_padding * (max_keys_in_row + 1))) // max_keys_in_row
         self.key_height = (keyboard_height - (key_padding * (num_rows + 1))) // num_rows
         
+        # Key pitch used to find the key under a touch without scanning every rect
+        self.keyboard_top = keyboard_top
+        self.key_pitch_x = self.key_width + key_padding
+        self.key_pitch_y = self.key_height + key_padding
+        
         # Store key rectangles for hit detection
         self.key_rects = []
         y = keyboard_top
@@ -53,43 +64,86 @@ class VirtualKeyboard:
                 x += self.key_width + key_padding
             self.key_rects.append(row_rects)
             y += self.key_height + key_padding
+        
+        # Pre-render key labels
+        key_font = self.display.get_text_font('md', 'medium')
+        self.key_labels = {
+            key: key_font.render(key, True, AppConfig.WHITE).convert_alpha()
+            for row in self.keys for key in row
+        }
+        
+        self._build_keyboard_surface()
+    
+    def _build_keyboard_surface(self):
+        """Draw every key into one surface covering the keyboard area."""
+        all_rects = [rect for row in self.key_rects for _, rect in row]
+        self.keyboard_rect = all_rects[0].unionall(all_rects[1:])
+        
+        # Every key shares the same background and border, draw it once
+        key_sprite = pygame.Surface(all_rects[0].size)
+        key_sprite.fill(AppConfig.KEY_BG_COLOR)
+        pygame.draw.rect(key_sprite, AppConfig.KEY_BORDER_COLOR, key_sprite.get_rect(), 1)
+        
+        self.keyboard_surface = pygame.Surface(self.keyboard_rect.size, pygame.SRCALPHA)
+        offset_x, offset_y = self.keyboard_rect.topleft
+        for row in self.key_rects:
+            for key, rect in row:
+                key_rect = rect.move(-offset_x, -offset_y)
+                self.keyboard_surface.blit(key_sprite, key_rect)
+                
+                key_text = self.key_labels[key]
+                key_text_rect = key_text.get_rect(center=key_rect.center)
+                self.keyboard_surface.blit(key_text, key_text_rect)
+        self.keyboard_surface = self.keyboard_surface.convert_alpha()
     
     def handle_input(self, x: float, y: float) -> bool:
         """
         Handle touch input at the given coordinates.
         Returns True if input was handled, False otherwise.
         """
-        for row in self.key_rects:
-            for key, rect in row:
-                if rect.collidepoint(x, y):
-                    if key == 'DEL':
-                        if self.text:
-                            self.text = self.text[:-1]
-                            logger.debug(f"Backspace pressed, current input: {self.text}")
-                    elif len(self.text) < self.max_length:
-                        self.text += key
-                        logger.debug(f"Key pressed: {key}, current input: {self.text}")
-                    
-                    if self.on_change:
-                        self.on_change(self.text)
-                    return True
-        return False
+        key = self._key_at(x, y)
+        if key is None:
+            return False
+        
+        handler = self.special_keys.get(key)
+        if handler:
+            handler()
+        elif len(self.text) < self.max_length:
+            self.text += key
+            logger.debug("Key pressed: %s, current input: %s", key, self.text)
+        
+        if self.on_change:
+            self.on_change(self.text)
+        return True
+    
+    def _delete_last(self):
+        """Remove the last typed character."""
+        if self.text:
+            self.text = self.text[:-1]
+            logger.debug("Backspace pressed, current input: %s", self.text)
+    
+    def _key_at(self, x: float, y: float) -> Optional[str]:
+        """Get the key under the given coordinates, or None if no key was hit."""
+        row_index = int((y - self.keyboard_top) // self.key_pitch_y)
+        if not 0 <= row_index < len(self.key_rects):
+            return None
+        
+        row = self.key_rects[row_index]
+        col_index = int((x - row[0][1].x) // self.key_pitch_x)
+        if not 0 <= col_index < len(row):
+            return None
+        
+        # Reject touches in the padding between keys
+        key, rect = row[col_index]
+        return key if rect.collidepoint(x, y) else None
     
     def draw(self):
         """Draw the keyboard on the surface."""
-        # Draw keyboard
-        for row in self.key_rects:
-            for key, rect in row:
-                pygame.draw.rect(self.surface, AppConfig.KEY_BG_COLOR, rect)
-                pygame.draw.rect(self.surface, AppConfig.KEY_BORDER_COLOR, rect, 1)
-                
-                key_text = self.display.get_text_font('md', 'medium').render(key, True, AppConfig.WHITE)
-                key_text_rect = key_text.get_rect(center=rect.center)
-                self.surface.blit(key_text, key_text_rect)
+        self.surface.blit(self.keyboard_surface, self.keyboard_rect)
     
     def set_text(self, text: str):
         """Set the current text value."""
-        self.text = text[:self.max_length]
+        self.text = text[:self.max_length].upper()  # Keep text in the case of the key labels
         if self.on_change:
             self.on_change(self.text)
     
@@ -47,63 +47,82 @@ class MenuGrid:
         display_width = self.display.surface.get_width()
         self.card_width = (display_width - (self.padding * (len(self.menu_items) + 1))) // len(self.menu_items)
         
+        # Pre-render the rounded card background shared by every item
+        self.card_background = pygame.Surface((self.card_width, self.card_height), pygame.SRCALPHA)
+        pygame.draw.rect(
+            self.card_background,
+            (30, 30, 30),
+            self.card_background.get_rect(),
+            border_radius=15
+        )
+        self.card_background = self.card_background.convert_alpha()
+        
+        # Pre-render the icons and titles, they never change
+        self.icon_surfaces = {}
+        self.title_surfaces = {}
+        title_font = self.display.get_text_font('sm', 'bold')
+        for item in self.menu_items:
+            icon = self.assets.get_icon(item['icon'], size=self.icon_size, color=AppConfig.WHITE)
+            if icon:
+                self.icon_surfaces[item['icon']] = icon.convert_alpha()
+            else:
+                logger.warning(f"Failed to load icon: {item['icon']}")
+            self.title_surfaces[item['title']] = title_font.render(item['title'], True, AppConfig.WHITE).convert_alpha()
+        
+        # Compose the whole row of cards once, drawing the grid is then a single blit
+        self.grid_surface = pygame.Surface((display_width, self.card_height), pygame.SRCALPHA)
+        self.item_rects = []
+        current_x = self.padding
+        for item in self.menu_items:
+            self.item_rects.append(self._draw_menu_item(self.grid_surface, item, current_x, 0))
+            current_x += self.card_width + self.padding
+        self.grid_surface = self.grid_surface.convert_alpha()
+        
         # Touch handling
-        self.last_touch_time = 0
+        self.last_touch_time = float('-inf')  # No tap yet, the first one is never debounced
         self.touch_delay = 0.3  # 300ms
         
         logger.info(f"MenuGrid initialized with card dimensions: {self.card_width}x{self.card_height}")
     
-    def _draw_menu_item(self, item: Dict, x: int, y: int) -> pygame.Rect:
-        """Draw a single menu item."""
+    def _draw_menu_item(self, surface: pygame.Surface, item: Dict, x: int, y: int) -> pygame.Rect:
+        """Draw a single menu item onto the given surface."""
         # Create item rectangle
         item_rect = pygame.Rect(x, y, self.card_width, self.card_height)
         
         # Draw background
-        pygame.draw.rect(
-            self.display.surface,
-            (30, 30, 30),
-            item_rect,
-            border_radius=15
-        )
+        surface.blit(self.card_background, item_rect)
         
         # Draw icon
-        icon = self.assets.get_icon(item['icon'], size=self.icon_size, color=AppConfig.WHITE)
+        icon = self.icon_surfaces.get(item['icon'])
         if icon:
             icon_rect = icon.get_rect(
                 centerx=item_rect.centerx,
                 centery=item_rect.centery - 10
             )
-            self.display.surface.blit(icon, icon_rect)
-            logger.debug(f"Drew icon {item['icon']} at {icon_rect}")
-        else:
-            logger.warning(f"Failed to load icon: {item['icon']}")
+            surface.blit(icon, icon_rect)
+            logger.debug("Drew icon %s at %s", item['icon'], icon_rect)
         
         # Draw title
-        title_font = self.display.get_text_font('sm', 'bold')
-        title_surface = title_font.render(item['title'], True, AppConfig.WHITE)
+        title_surface = self.title_surfaces[item['title']]
         title_rect = title_surface.get_rect(
             centerx=item_rect.centerx,
             top=item_rect.centery + 20
         )
-        self.display.surface.blit(title_surface, title_rect)
+        surface.blit(title_surface, title_rect)
         
         return item_rect
     
     def draw(self, start_y: int) -> List[Tuple[pygame.Rect, str]]:
         """Draw the menu grid."""
-        clickable_areas = []
-        current_x = self.padding
-        
-        for item in self.menu_items:
-            item_rect = self._draw_menu_item(item, current_x, start_y)
-            clickable_areas.append((item_rect, item['screen']))
-            current_x += self.card_width + self.padding
-        
-        return clickable_areas
+        self.display.surface.blit(self.grid_surface, (0, start_y))
+        return [
+            (item_rect.move(0, start_y), item['screen'])
+            for item_rect, item in zip(self.item_rects, self.menu_items)
+        ]
     
     def handle_click(self, pos: Tuple[int, int], clickable_areas: List[Tuple[pygame.Rect, str]]) -> None:
         """Handle touch events."""
-        current_time = time.time()
+        current_time = time.monotonic()  # Interval timing, unaffected by wall clock adjustments
         if current_time - self.last_touch_time < self.touch_delay:
             return
         
@@ -27,6 +27,8 @@ class TopMovers:
         spacing_between = 20  # 20px between cards
         total_spacing = total_padding + (spacing_between * 2)
         self.card_width = (AppConfig.DISPLAY_WIDTH - total_spacing) // 3
+        self.card_pitch = self.card_width + spacing_between  # Distance between card left edges
+        self.card_xs = [20 + i * self.card_pitch for i in range(3)]
         
         # Card dimensions and styling
         self.logo_size = 52  # Increased logo size
@@ -38,12 +40,21 @@ class TopMovers:
         self.trending_up = pygame.image.load(os.path.join(AppConfig.ASSETS_DIR, 'icons', 'trending-up.svg'))
         self.trending_down = pygame.image.load(os.path.join(AppConfig.ASSETS_DIR, 'icons', 'trending-down.svg'))
         self.trending_icon_size = 42  # Increased from 24 to 42
-        self.trending_up = pygame.transform.scale(self.trending_up, (self.trending_icon_size, self.trending_icon_size))
-        self.trending_down = pygame.transform.scale(self.trending_down, (self.trending_icon_size, self.trending_icon_size))
+        self.trending_up = pygame.transform.scale(self.trending_up, (self.trending_icon_size, self.trending_icon_size)).convert_alpha()
+        self.trending_down = pygame.transform.scale(self.trending_down, (self.trending_icon_size, self.trending_icon_size)).convert_alpha()
         
         # Cache for logo colors
         self.logo_colors = {}
         
+        # Scaled circular logos keyed by logo path
+        self.logo_cache = {}
+        
+        # Rounded card backgrounds keyed by color
+        self.card_backgrounds = {}
+        
+        # Rendered card text keyed by (font, text, color), percentages repeat between updates
+        self.text_cache = {}
+        
         # State
         self.movers: List[Dict] = []
         
@@ -90,6 +101,27 @@ class TopMovers:
             reverse=True
         )[:3]
 
+    def _render_text(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """Render text, reusing the cached surface when possible."""
+        key = (font, text, color)
+        text_surface = self.text_cache.get(key)
+        if text_surface is None:
+            if len(self.text_cache) >= 256:  # Percentages keep changing, drop stale renders
+                self.text_cache.clear()
+            text_surface = font.render(text, True, color).convert_alpha()
+            self.text_cache[key] = text_surface
+        return text_surface
+    
+    def _get_card_background(self, color: tuple) -> pygame.Surface:
+        """Get the rounded card background for a color, rendering it on first use."""
+        card_background = self.card_backgrounds.get(color)
+        if card_background is None:
+            card_background = pygame.Surface((self.card_width, self.card_height), pygame.SRCALPHA)
+            pygame.draw.rect(card_background, color, card_background.get_rect(), border_radius=15)
+            card_background = card_background.convert_alpha()
+            self.card_backgrounds[color] = card_background
+        return card_background
+    
     def _create_circular_icon(self, surface: pygame.Surface) -> pygame.Surface:
         """Create a circular icon from a square surface."""
         size = surface.get_width()
@@ -112,19 +144,17 @@ class TopMovers:
         bg_color = self._get_dominant_color(logo_path) if os.path.exists(logo_path) else (30, 30, 30)
         
         # Draw card background
-        pygame.draw.rect(
-            self.display.surface,
-            bg_color,
-            card_rect,
-            border_radius=15
-        )
+        self.display.surface.blit(self._get_card_background(bg_color), card_rect)
         
         # Draw logo in top left
         if os.path.exists(logo_path):
             try:
-                logo = pygame.image.load(logo_path)
-                logo = pygame.transform.scale(logo, (self.logo_size, self.logo_size))
-                logo = self._create_circular_icon(logo)
+                logo = self.logo_cache.get(logo_path)
+                if logo is None:
+                    logo = pygame.image.load(logo_path)
+                    logo = pygame.transform.scale(logo, (self.logo_size, self.logo_size))
+                    logo = self._create_circular_icon(logo).convert_alpha()
+                    self.logo_cache[logo_path] = logo
                 logo_rect = logo.get_rect(
                     left=card_rect.left + self.side_padding,
                     top=card_rect.top + self.top_padding
@@ -133,7 +163,7 @@ class TopMovers:
                 
                 # Draw symbol (ticker) to the right of logo
                 symbol_font = self.display.get_title_font('md', 'bold')
-                symbol_surface = symbol_font.render(coin['symbol'].upper(), True, AppConfig.WHITE)
+                symbol_surface = self._render_text(symbol_font, coin['symbol'].upper(), AppConfig.WHITE)
                 symbol_rect = symbol_surface.get_rect(
                     left=logo_rect.right + 15,
                     centery=logo_rect.centery
@@ -144,7 +174,7 @@ class TopMovers:
                 change = float(coin.get('price_change_24h', 0))
                 change_text = f"{'+' if change >= 0 else ''}{change:.1f}%"
                 change_font = self.display.get_title_font('xl', 'bold')
-                change_surface = change_font.render(change_text, True, AppConfig.WHITE)
+                change_surface = self._render_text(change_font, change_text, AppConfig.WHITE)
                 
                 # Calculate maximum width available for percentage
                 max_width = card_rect.width - (self.side_padding * 2)
@@ -152,7 +182,7 @@ class TopMovers:
                 # Scale down font if needed to fit within card
                 if change_surface.get_width() > max_width:
                     change_font = self.display.get_title_font('md', 'bold')
-                    change_surface = change_font.render(change_text, True, AppConfig.WHITE)
+                    change_surface = self._render_text(change_font, change_text, AppConfig.WHITE)
                 
                 change_rect = change_surface.get_rect(
                     left=card_rect.left + self.side_padding,
@@ -178,7 +208,7 @@ class TopMovers:
         
         # Draw section title
         title_font = self.display.get_text_font('md', 'bold')
-        title_surface = title_font.render("Top Movers", True, AppConfig.WHITE)
+        title_surface = self._render_text(title_font, "Top Movers", AppConfig.WHITE)
         title_rect = title_surface.get_rect(
             left=20,
             top=start_y
@@ -187,32 +217,26 @@ class TopMovers:
         
         # Draw mover cards
         card_y = title_rect.bottom + 15
-        card_x = 20
-        spacing = 20  # Space between cards
-        
-        for coin in self.movers:
+        for coin, card_x in zip(self.movers, self.card_xs):
             self._draw_mover_card(coin, card_x, card_y)
-            card_x += self.card_width + spacing 
 
     def handle_event(self, event: pygame.event.Event, start_y: int) -> bool:
         """Handle touch events on the cards."""
         if event.type == pygame.MOUSEBUTTONDOWN:
             mouse_pos = event.pos
             
-            # Calculate card positions
+            x, y = mouse_pos
+            
+            # Cards sit in a single row, so the touched card follows from the x offset
             card_y = start_y + self.display.get_text_font('md', 'bold').get_height() + 15
-            card_x = 20
-            spacing = 20
+            card_x = self.card_xs[0]
             
-            # Check each card
-            for coin in self.movers:
-                card_rect = pygame.Rect(card_x, card_y, self.card_width, self.card_height)
-                
-                if card_rect.collidepoint(mouse_pos):
+            if card_y <= y < card_y + self.card_height and x >= card_x:
+                index, offset = divmod(x - card_x, self.card_pitch)
+                # Ignore touches in the gap between cards
+                if offset < self.card_width and index < len(self.movers):
                     # Navigate to ticker screen for this coin
-                    self.screen_manager.switch_screen('ticker', coin_id=coin['id'])
+                    self.screen_manager.switch_screen('ticker', coin_id=self.movers[int(index)]['id'])
                     return True
-                
-                card_x += self.card_width + spacing 
         
         return False 
\ No newline at end of file
@@ -1 +0,0 @@
-"""Managers package for crypto tracker.""" 
\ No newline at end of file
@@ -56,8 +56,113 @@ class AddTickerScreen(BaseScreen):
             toggle_height
         )
         
+        # Pre-render static labels
+        header_font = self.display.get_title_font('md', 'bold')
+        self.header_surfaces = {
+            True: header_font.render("Add Coin", True, AppConfig.WHITE).convert_alpha(),
+            False: header_font.render("Add Stock", True, AppConfig.WHITE).convert_alpha()
+        }
+        input_font = self.display.get_text_font('lg', 'regular')
+        self.placeholder_surface = input_font.render("Enter symbol", True, (128, 128, 128)).convert_alpha()
+        label_font = self.display.get_text_font('md', 'regular')
+        self.label_surfaces = {
+            text: label_font.render(text, True, AppConfig.WHITE).convert_alpha()
+            for text in ("CRYPTO", "STOCK", "Cancel", "Save", "Next")
+        }
+        
+        # Rendered exchange rows and error messages keyed by (font, text, color)
+        self._text_cache = {}
+        
+        # Input box below the header
+        input_box_height = 50
+        input_box_width = self.width - 160 - 40  # Reduced width to make room for toggle
+        self.input_box_rect = pygame.Rect(
+            20,
+            20 + self.header_surfaces[True].get_height() + 30,
+            input_box_width,
+            input_box_height
+        )
+        
+        # Exchange list shown in place of the keyboard in stock mode
+        self.exchange_list_rect = pygame.Rect(
+            20,
+            self.input_box_rect.bottom + 20,
+            self.width - 40,
+            self.height - self.input_box_rect.bottom - 100  # Leave space for buttons at bottom
+        )
+        self.exchange_height = 60  # Make items bigger since we have more space
+        
+        # Pre-render the rounded exchange list background and selection highlight
+        self.exchange_list_background = self._create_rounded_surface(
+            self.exchange_list_rect.size,
+            (30, 30, 30),  # Slightly darker than input box
+            10
+        )
+        self.exchange_highlight = self._create_rounded_surface(
+            (self.exchange_list_rect.width - 10, self.exchange_height - 10),
+            (45, 45, 45),  # Highlight color
+            8
+        )
+        
+        # Pre-compose the static parts of the screen for each mode
+        self.static_backgrounds = {
+            is_crypto_mode: self._create_static_background(is_crypto_mode)
+            for is_crypto_mode in (True, False)
+        }
+        
+        # Whether the pending redraw only needs to refresh the input box
+        self._input_only = False
+        
         logger.info("AddTickerScreen initialized")
     
+    def _create_rounded_surface(self, size: tuple, color: tuple, radius: int) -> pygame.Surface:
+        """Render a filled rounded rectangle on a transparent surface."""
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(surface, color, surface.get_rect(), border_radius=radius)
+        return surface.convert_alpha()
+    
+    def _create_static_background(self, is_crypto_mode: bool) -> pygame.Surface:
+        """Draw the background, header, input box, toggle and button chrome for a mode."""
+        surface = pygame.Surface((self.width, self.height))
+        surface.fill(self.background_color)
+        
+        # Header
+        header_surface = self.header_surfaces[is_crypto_mode]
+        surface.blit(header_surface, header_surface.get_rect(centerx=self.width // 2, top=20))
+        
+        # Input box background
+        pygame.draw.rect(
+            surface,
+            (45, 45, 45),  # Dark gray background
+            self.input_box_rect,
+            border_radius=10
+        )
+        
+        # Toggle button
+        pygame.draw.rect(
+            surface,
+            (45, 45, 45) if not is_crypto_mode else (39, 174, 96),  # Green when in crypto mode
+            self.toggle_rect,
+            border_radius=10
+        )
+        toggle_surface = self.label_surfaces["CRYPTO" if is_crypto_mode else "STOCK"]
+        surface.blit(toggle_surface, toggle_surface.get_rect(center=self.toggle_rect.center))
+        
+        # Cancel and Save/Next buttons, the Save/Next label is drawn per frame
+        button_color = (45, 45, 45)  # Dark gray
+        corner_radius = self.button_height // 2  # Fully rounded corners
+        pygame.draw.rect(surface, button_color, self.cancel_rect, border_radius=corner_radius)
+        cancel_surface = self.label_surfaces["Cancel"]
+        surface.blit(cancel_surface, cancel_surface.get_rect(center=self.cancel_rect.center))
+        pygame.draw.rect(surface, button_color, self.save_rect, border_radius=corner_radius)
+        
+        return surface.convert()
+    
+    def on_screen_enter(self, **kwargs) -> None:
+        """Called when entering the screen."""
+        super().on_screen_enter(**kwargs)
+        self._input_only = False
+    
     def _reset_state(self):
         """Reset the screen state."""
         self.keyboard.set_text("")
@@ -145,120 +250,92 @@ class AddTickerScreen(BaseScreen):
             self.error_message = "Error adding ticker"
             self.draw()  # Force redraw to show error
     
-    def draw(self) -> None:
-        """Draw the add ticker screen."""
-        # Fill background
-        self.display.surface.fill(self.background_color)
-        
-        # Draw header
-        header_text = "Add Coin" if self.is_crypto_mode else "Add Stock"
-        header_font = self.display.get_title_font('md', 'bold')
-        header_surface = header_font.render(header_text, True, AppConfig.WHITE)
-        header_rect = header_surface.get_rect(
-            centerx=self.width // 2,
-            top=20
-        )
-        self.display.surface.blit(header_surface, header_rect)
-        
-        # Draw input box
-        input_box_height = 50
-        input_box_width = self.width - 160 - 40  # Reduced width to make room for toggle
-        input_box_rect = pygame.Rect(
-            20,
-            header_rect.bottom + 30,
-            input_box_width,
-            input_box_height
-        )
-        
-        # Draw input box background
-        pygame.draw.rect(
-            self.display.surface,
-            (45, 45, 45),  # Dark gray background
-            input_box_rect,
-            border_radius=10
-        )
-        
-        # Draw current input text
-        input_text = self.keyboard.get_text().upper()
+    def _draw_input_text(self) -> None:
+        """Draw the typed symbol, or the placeholder, centered in the input box."""
+        input_text = self.keyboard.get_text()  # Already uppercase, built from the key labels
         if not input_text:
             # Draw placeholder
-            input_text = "Enter symbol"
-            text_color = (128, 128, 128)  # Gray for placeholder
+            input_surface = self.placeholder_surface
         else:
-            text_color = AppConfig.WHITE
-        
-        input_font = self.display.get_text_font('lg', 'regular')
-        input_surface = input_font.render(input_text, True, text_color)
+            input_font = self.display.get_text_font('lg', 'regular')
+            input_surface = input_font.render(input_text, True, AppConfig.WHITE)
         input_text_rect = input_surface.get_rect(
-            center=input_box_rect.center
+            center=self.input_box_rect.center
         )
         self.display.surface.blit(input_surface, input_text_rect)
-        
-        # Draw toggle button
-        pygame.draw.rect(
-            self.display.surface,
-            (45, 45, 45) if not self.is_crypto_mode else (39, 174, 96),  # Green when in crypto mode
-            self.toggle_rect,
-            border_radius=10
+    
+    def _render_text(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """Render text, reusing the cached surface when possible."""
+        key = (font, text, color)
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            if len(self._text_cache) >= 256:  # Exchange lists change per symbol, drop stale renders
+                self._text_cache.clear()
+            text_surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = text_surface
+        return text_surface
+    
+    def _draw_input_box(self) -> None:
+        """Redraw only the input box, restoring its background from the static layer."""
+        self.display.surface.blit(
+            self.static_backgrounds[self.is_crypto_mode],
+            self.input_box_rect,
+            area=self.input_box_rect
         )
+        self._draw_input_text()
+    
+    def draw(self) -> None:
+        """Draw the add ticker screen."""
+        # Typing only changes the input box
+        if self._input_only:
+            self._draw_input_box()
+            self._input_only = False
+            self.needs_redraw = False
+            return
+        
+        surface = self.display.surface
         
-        toggle_text = "CRYPTO" if self.is_crypto_mode else "STOCK"
-        toggle_font = self.display.get_text_font('md', 'regular')
-        toggle_surface = toggle_font.render(toggle_text, True, AppConfig.WHITE)
-        toggle_text_rect = toggle_surface.get_rect(center=self.toggle_rect.center)
-        self.display.surface.blit(toggle_surface, toggle_text_rect)
+        # Draw background, header, input box, toggle and button chrome
+        surface.blit(self.static_backgrounds[self.is_crypto_mode], (0, 0))
+        
+        # Draw current input text
+        self._draw_input_text()
         
         # Draw exchange list if in stock mode and showing exchanges
         if not self.is_crypto_mode and self.showing_exchanges and self.available_exchanges:
             # Use full height for exchange list when showing exchanges
-            exchange_list_rect = pygame.Rect(
-                20,
-                input_box_rect.bottom + 20,
-                self.width - 40,
-                self.height - input_box_rect.bottom - 100  # Leave space for buttons at bottom
-            )
+            exchange_list_rect = self.exchange_list_rect
             
             # Draw exchange list background
-            pygame.draw.rect(
-                self.display.surface,
-                (30, 30, 30),  # Slightly darker than input box
-                exchange_list_rect,
-                border_radius=10
-            )
+            surface.blit(self.exchange_list_background, exchange_list_rect)
             
             # Draw exchanges
             exchange_font = self.display.get_text_font('md', 'regular')
-            exchange_height = 60  # Make items bigger since we have more space
-            visible_exchanges = min(len(self.available_exchanges), (exchange_list_rect.height - 20) // exchange_height)
+            exchange_height = self.exchange_height
+            exchanges = self.available_exchanges
+            selected_index = self.selected_exchange_index
+            visible_exchanges = min(len(exchanges), (exchange_list_rect.height - 20) // exchange_height)
             
             for i in range(visible_exchanges):
-                exchange = self.available_exchanges[i]
-                is_selected = i == self.selected_exchange_index
+                exchange = exchanges[i]
+                is_selected = i == selected_index
                 
                 # Draw selection highlight
                 if is_selected:
-                    highlight_rect = pygame.Rect(
-                        exchange_list_rect.left + 5,
-                        exchange_list_rect.top + (i * exchange_height) + 5,
-                        exchange_list_rect.width - 10,
-                        exchange_height - 10
-                    )
-                    pygame.draw.rect(
-                        self.display.surface,
-                        (45, 45, 45),  # Highlight color
-                        highlight_rect,
-                        border_radius=8
+                    surface.blit(
+                        self.exchange_highlight,
+                        (exchange_list_rect.left + 5, exchange_list_rect.top + (i * exchange_height) + 5)
                     )
                 
                 # Draw exchange text
                 exchange_text = f"{exchange['symbol']} - {exchange['name']}"
                 text_color = AppConfig.WHITE if is_selected else (200, 200, 200)
-                exchange_surface = exchange_font.render(exchange_text, True, text_color)
+                exchange_surface = self._render_text(exchange_font, exchange_text, text_color)
                 exchange_text_rect = exchange_surface.get_rect(
                     left=exchange_list_rect.left + 20,
                     centery=exchange_list_rect.top + (i * exchange_height) + (exchange_height // 2)
                 )
-                self.display.surface.blit(exchange_surface, exchange_text_rect)
+                surface.blit(exchange_surface, exchange_text_rect)
         
         # Draw keyboard only if not showing exchanges
         if not self.showing_exchanges:
@@ -267,42 +344,18 @@ class AddTickerScreen(BaseScreen):
         # Draw error message if any
         if self.error_message:
             error_font = self.display.get_text_font('md', 'bold')
-            error_surface = error_font.render(self.error_message, True, AppConfig.RED)
+            error_surface = self._render_text(error_font, self.error_message, AppConfig.RED)
             error_rect = error_surface.get_rect(
                 centerx=self.width // 2,
                 bottom=self.height - 80  # Position above buttons
             )
-            self.display.surface.blit(error_surface, error_rect)
-        
-        # Draw buttons
-        button_color = (45, 45, 45)  # Dark gray
-        corner_radius = self.button_height // 2  # Fully rounded corners
-        
-        # Cancel button
-        pygame.draw.rect(
-            self.display.surface,
-            button_color,
-            self.cancel_rect,
-            border_radius=corner_radius
-        )
-        cancel_text = "Cancel"
-        cancel_font = self.display.get_text_font('md', 'regular')
-        cancel_surface = cancel_font.render(cancel_text, True, AppConfig.WHITE)
-        cancel_text_rect = cancel_surface.get_rect(center=self.cancel_rect.center)
-        self.display.surface.blit(cancel_surface, cancel_text_rect)
+            surface.blit(error_surface, error_rect)
         
-        # Save/Next button
-        pygame.draw.rect(
-            self.display.surface,
-            button_color,
-            self.save_rect,
-            border_radius=corner_radius
-        )
+        # Draw Save/Next label
         save_text = "Save" if self.is_crypto_mode or (not self.is_crypto_mode and self.showing_exchanges) else "Next"
-        save_font = self.display.get_text_font('md', 'regular')
-        save_surface = save_font.render(save_text, True, AppConfig.WHITE)
+        save_surface = self.label_surfaces[save_text]
         save_text_rect = save_surface.get_rect(center=self.save_rect.center)
-        self.display.surface.blit(save_surface, save_text_rect)
+        surface.blit(save_surface, save_text_rect)
         
         # Reset needs_redraw flag
         self.needs_redraw = False
@@ -317,6 +370,13 @@ class AddTickerScreen(BaseScreen):
         elif event.type == AppConfig.EVENT_TYPES['FINGER_DOWN']:
             x, y = self._scale_touch_input(event)
             
+            # Any tap can change what is shown on this screen
+            previous_redraw = (self.needs_redraw, self._input_only, self.dirty_rects)
+            full_redraw_pending = self.needs_redraw and not self._input_only
+            self.needs_redraw = True
+            self._input_only = False
+            self.dirty_rects = []
+            
             # Check toggle button first
             if self.toggle_rect.collidepoint(x, y):
                 self.is_crypto_mode = not self.is_crypto_mode
@@ -325,29 +385,40 @@ class AddTickerScreen(BaseScreen):
                 logger.info(f"Switched to {'Crypto' if self.is_crypto_mode else 'Stock'} mode")
                 return
             
-            # Check keyboard input only if not showing exchanges
-            if not self.showing_exchanges and self.keyboard.handle_input(x, y):
-                return
-            
+            # Check the Cancel and Save/Next buttons before the keyboard
             if self.cancel_rect.collidepoint(x, y):
                 logger.info("Cancel button clicked")
                 self.screen_manager.switch_screen('settings')
-            elif self.save_rect.collidepoint(x, y):
+                return
+            if self.save_rect.collidepoint(x, y):
                 logger.info("Save/Next button clicked")
                 self.add_ticker()
+                return
+            
+            # Check keyboard input only if not showing exchanges
+            had_error = self.error_message is not None
+            if not self.showing_exchanges and self.keyboard.handle_input(x, y):
+                # Typing only changes the input box unless an error was cleared
+                if not had_error and not full_redraw_pending:
+                    self._input_only = True
+                    self.dirty_rects = [self.input_box_rect]
+                return
             
             # Handle exchange selection if showing exchanges
-            elif not self.is_crypto_mode and self.showing_exchanges and self.available_exchanges:
+            if not self.is_crypto_mode and self.showing_exchanges and self.available_exchanges:
                 exchange_list_top = self.toggle_rect.bottom + 20
-                exchange_height = 60  # Match the height in draw method
-                for i in range(min(len(self.available_exchanges), (self.height - exchange_list_top - 100) // exchange_height)):
-                    exchange_rect = pygame.Rect(
-                        20,
-                        exchange_list_top + (i * exchange_height),
-                        self.width - 40,
-                        exchange_height
-                    )
-                    if exchange_rect.collidepoint(x, y):
+                exchange_height = self.exchange_height
+                visible_exchanges = min(len(self.available_exchanges), (self.height - exchange_list_top - 100) // exchange_height)
+                
+                # Rows are stacked at a fixed height, so the touched row follows from y
+                if 20 <= x < self.width - 20 and y >= exchange_list_top:
+                    i = (y - exchange_list_top) // exchange_height
+                    if i < visible_exchanges and i != self.selected_exchange_index:
                         self.selected_exchange_index = i
-                        self.draw()
-                        break 
\ No newline at end of file
+                        # Only the highlighted row changed, push just the exchange list
+                        if not full_redraw_pending:
+                            self.dirty_rects = [self.exchange_list_rect]
+                        return
+            
+            # The tap changed nothing, keep only the redraw that was already pending
+            self.needs_redraw, self._input_only, self.dirty_rects = previous_redraw 
\ No newline at end of file
@@ -15,6 +15,9 @@ logger = get_logger(__name__)
 class BaseScreen:
     """Base class for all screens in the application."""
     
+    # Full-screen overlays shared by all screens, keyed by (size, color)
+    _overlay_cache: Dict[Tuple[Tuple[int, int], Tuple[int, ...]], pygame.Surface] = {}
+    
     def __init__(self, display) -> None:
         """Initialize the base screen."""
         # Store passed display instance
@@ -32,6 +35,7 @@ class BaseScreen:
         self.width = AppConfig.DISPLAY_WIDTH
         self.height = AppConfig.DISPLAY_HEIGHT
         self.needs_redraw = True
+        self.dirty_rects = []  # Regions to push on the next redraw, empty means the full screen
         self.background_color = AppConfig.BLACK
         
         # Create a surface for double buffering
@@ -42,6 +46,17 @@ class BaseScreen:
         
         logger.info(f"{self.__class__.__name__} initialized with dimensions {self.width}x{self.height}")
     
+    def _get_overlay(self, color: Tuple[int, ...]) -> pygame.Surface:
+        """Get a shared full-screen overlay filled with the given RGBA color."""
+        key = ((self.width, self.height), tuple(color))
+        overlay = BaseScreen._overlay_cache.get(key)
+        if overlay is None:
+            overlay = pygame.Surface(key[0], pygame.SRCALPHA)
+            overlay.fill(color)
+            overlay = overlay.convert_alpha()
+            BaseScreen._overlay_cache[key] = overlay
+        return overlay
+    
     def on_screen_enter(self, **kwargs) -> None:
         """Called when entering the screen. Override in subclasses."""
         self.needs_redraw = True
@@ -50,12 +65,16 @@ class BaseScreen:
         """Called when exiting the screen. Override in subclasses."""
         pass
     
+    def update(self) -> None:
+        """Update screen state periodically. Override in subclasses."""
+        pass
+    
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handle pygame events."""
-        logger.debug(f"{self.__class__.__name__} received event type: {event.type}")
+        logger.debug("%s received event type: %s", self.__class__.__name__, event.type)
         gestures = self.gesture_handler.handle_touch_event(event)
         if any(gestures.values()):
-            logger.debug(f"{self.__class__.__name__} detected gestures: {gestures}")
+            logger.debug("%s detected gestures: %s", self.__class__.__name__, gestures)
         self._handle_gestures(gestures)
     
     def _handle_gestures(self, gestures: Dict[str, bool]) -> None:
@@ -79,9 +98,7 @@ class BaseScreen:
     
     def _scale_touch_input(self, event: pygame.event.Event) -> Tuple[int, int]:
         """Scale touch input coordinates to screen dimensions."""
-        scaled_x = int(event.x * self.width)
-        scaled_y = int(event.y * self.height)
-        return (scaled_x, scaled_y)
+        return int(event.x * self.width), int(event.y * self.height)
     
     def get_current_time(self) -> str:
         """Get the current time formatted for display."""
@@ -7,7 +7,6 @@ from ..utils.logger import get_logger
 from .base_screen import BaseScreen
 from ..components.top_movers import TopMovers
 from ..components.menu_grid import MenuGrid
-from ..managers.crypto_manager import CryptoManager
 
 logger = get_logger(__name__)
 
@@ -20,7 +19,6 @@ class DashboardScreen(BaseScreen):
         self.background_color = (13, 13, 13)  # Darker black for more contrast
         
         # Initialize components
-        self.crypto_manager = CryptoManager()
         self.top_movers = TopMovers(display, self.crypto_manager)
         self.menu_grid = None  # Will be initialized when screen_manager is set
         
@@ -36,6 +34,12 @@ class DashboardScreen(BaseScreen):
         # Track last time update
         self.last_time = self.get_current_time()
         
+        # Rendered date and time, re-rendered only when their text changes
+        self._date_text = None
+        self._date_surface = None
+        self._time_text = None
+        self._time_surface = None
+        
         logger.info("DashboardScreen initialized")
     
     def update(self) -> None:
@@ -87,8 +91,12 @@ class DashboardScreen(BaseScreen):
         self.display.surface.fill(self.background_color)
         
         # Draw date
-        date_font = self.display.get_text_font('md', 'regular')
-        date_surface = date_font.render(self.get_current_date(), True, AppConfig.GRAY)
+        date_text = self.get_current_date()
+        if date_text != self._date_text:
+            date_font = self.display.get_text_font('md', 'regular')
+            self._date_surface = date_font.render(date_text, True, AppConfig.GRAY).convert_alpha()
+            self._date_text = date_text
+        date_surface = self._date_surface
         date_rect = date_surface.get_rect(
             centerx=self.width // 2,
             top=20
@@ -96,8 +104,12 @@ class DashboardScreen(BaseScreen):
         self.display.surface.blit(date_surface, date_rect)
         
         # Draw time
-        time_font = self.display.get_title_font('xl', 'bold')
-        time_surface = time_font.render(self.get_current_time(), True, AppConfig.WHITE)
+        time_text = self.get_current_time()
+        if time_text != self._time_text:
+            time_font = self.display.get_title_font('xl', 'bold')
+            self._time_surface = time_font.render(time_text, True, AppConfig.WHITE).convert_alpha()
+            self._time_text = time_text
+        time_surface = self._time_surface
         time_rect = time_surface.get_rect(
             centerx=self.width // 2,
             top=date_rect.bottom + 10
@@ -48,8 +48,48 @@ class EditTickerScreen(BaseScreen):
             self.button_height
         )
         
+        # Pre-render the button chrome and labels
+        button_color = (45, 45, 45)  # Dark gray
+        self.favorite_button = self._create_button_surface(button_color, "Favorite")
+        self.unfavorite_button = self._create_button_surface((255, 165, 0), "Unfavorite")
+        self.delete_button = self._create_button_surface(button_color, "Delete")
+        self.back_button = self._create_button_surface(button_color, "Back")
+        
+        # Favorite star is tinted once instead of on every draw
+        self.star_icon = self.assets.get_icon('star', size=(24, 24), color=(255, 165, 0))
+        if self.star_icon:
+            self.star_icon = self.star_icon.convert_alpha()
+        
+        # Area next to the symbol where the favorite star is drawn, set in draw()
+        self.star_rect = None
+        self._favorite_only = False  # Only the favorite button and star need repainting
+        self._favorite_backdrops = []  # Screen content under the star and favorite button
+        
+        # Coin name and symbol text, rendered when a coin's displayed fields change
+        self.name_surface = None
+        self.symbol_surface = None
+        self._text_fields = None
+        
+        # Scaled logo of the current coin, reloaded when another coin is shown
+        self.logo_surface = None
+        self._logo_path = None
+        
         logger.info("EditTickerScreen initialized")
     
+    def _create_button_surface(self, color: tuple, text: str) -> pygame.Surface:
+        """Render a rounded button with a centered label."""
+        surface = pygame.Surface((self.button_width, self.button_height), pygame.SRCALPHA)
+        pygame.draw.rect(
+            surface,
+            color,
+            surface.get_rect(),
+            border_radius=self.button_height // 2  # Fully rounded corners
+        )
+        font = self.display.get_text_font('md', 'regular')
+        text_surface = font.render(text, True, AppConfig.WHITE)
+        surface.blit(text_surface, text_surface.get_rect(center=surface.get_rect().center))
+        return surface.convert_alpha()
+    
     def load_coin(self, coin_id: str) -> None:
         """Load coin data for editing."""
         # Try crypto storage first
@@ -65,6 +105,18 @@ class EditTickerScreen(BaseScreen):
         else:
             logger.info(f"Loaded crypto: {coin_id}")
     
+    def _update_text_surfaces(self) -> None:
+        """Render the coin name and symbol if they changed since the last render."""
+        fields = (self.current_coin['name'], self.current_coin['symbol'])
+        if fields == self._text_fields:
+            return
+        
+        self._text_fields = fields
+        name_font = self.display.get_title_font('lg', 'bold')
+        self.name_surface = name_font.render(fields[0], True, AppConfig.WHITE).convert_alpha()
+        symbol_font = self.display.get_title_font('md', 'light')
+        self.symbol_surface = symbol_font.render(fields[1].upper(), True, AppConfig.GRAY).convert_alpha()
+    
     def delete_coin(self) -> None:
         """Delete the current coin."""
         if self.current_coin and self.crypto_manager.remove_coin(self.current_coin['id']):
@@ -82,13 +134,33 @@ class EditTickerScreen(BaseScreen):
                     self.current_coin = self.crypto_manager.storage.get_coin(self.current_coin['id'])
                     
                 logger.info(f"Toggled favorite state for {self.current_coin['symbol']}")
-                # Force redraw to show updated state
-                self.draw()
+                # Redraw to show updated state, only the button and star change
+                self.needs_redraw = True
+                if self.star_rect:
+                    self._favorite_only = True
+                    self.dirty_rects = [self.favorite_rect, self.star_rect]
+    
+    def _draw_favorite_state(self, surface: pygame.Surface) -> None:
+        """Draw the favorite star and button over the content captured beneath them."""
+        is_favorite = self.current_coin.get('favorite', False)
+        surface.blits(self._favorite_backdrops, doreturn=False)
+        
+        if is_favorite and self.star_icon:
+            surface.blit(self.star_icon, self.star_rect)
+        
+        surface.blit(self.unfavorite_button if is_favorite else self.favorite_button, self.favorite_rect)
     
     def draw(self) -> None:
         """Draw the edit ticker screen."""
         if not self.current_coin:
             return
+        
+        # A favorite toggle only repaints the areas it changed
+        if self._favorite_only:
+            self._favorite_only = False
+            self._draw_favorite_state(self.display.surface)
+            self.needs_redraw = False
+            return
             
         # Fill background
         self.display.surface.fill(self.background_color)
@@ -98,8 +170,11 @@ class EditTickerScreen(BaseScreen):
         logo_path = os.path.join(AppConfig.CACHE_DIR, f"{self.current_coin['symbol'].lower()}_logo.png")
         if os.path.exists(logo_path):
             try:
-                logo = pygame.image.load(logo_path)
-                logo = pygame.transform.scale(logo, (logo_size, logo_size))
+                if logo_path != self._logo_path:
+                    logo = pygame.image.load(logo_path)
+                    self.logo_surface = pygame.transform.scale(logo, (logo_size, logo_size)).convert_alpha()
+                    self._logo_path = logo_path
+                logo = self.logo_surface
                 logo_rect = logo.get_rect(
                     centerx=int(self.width * 0.25),  # Center in left half
                     top=int(self.height * 0.2)  # Position at 20% of screen height
@@ -108,9 +183,10 @@ class EditTickerScreen(BaseScreen):
             except Exception as e:
                 logger.error(f"Error loading logo: {e}")
         
+        self._update_text_surfaces()
+        
         # Draw coin name
-        name_font = self.display.get_title_font('lg', 'bold')
-        name_surface = name_font.render(self.current_coin['name'], True, AppConfig.WHITE)
+        name_surface = self.name_surface
         name_rect = name_surface.get_rect(
             centerx=int(self.width * 0.25),  # Center in left half
             top=int(self.height * 0.2) + logo_size + 20  # Below logo
@@ -118,64 +194,29 @@ class EditTickerScreen(BaseScreen):
         self.display.surface.blit(name_surface, name_rect)
         
         # Draw coin symbol
-        symbol_font = self.display.get_title_font('md', 'light')
-        symbol_surface = symbol_font.render(self.current_coin['symbol'].upper(), True, AppConfig.GRAY)
+        symbol_surface = self.symbol_surface
         symbol_rect = symbol_surface.get_rect(
             centerx=int(self.width * 0.25),  # Center in left half
             top=name_rect.bottom + 10
         )
         self.display.surface.blit(symbol_surface, symbol_rect)
         
-        # Draw star icon if favorited
-        if self.current_coin.get('favorite', False):
-            star_icon = self.assets.get_icon('star', size=(24, 24), color=(255, 165, 0))
-            if star_icon:
-                star_rect = star_icon.get_rect(
-                    left=symbol_rect.right + 10,
-                    centery=symbol_rect.centery
-                )
-                self.display.surface.blit(star_icon, star_rect)
+        # Draw star icon if favorited and the favorite button
+        self.star_rect = pygame.Rect(0, 0, 24, 24)
+        self.star_rect.left = symbol_rect.right + 10
+        self.star_rect.centery = symbol_rect.centery
         
-        # Draw buttons
-        button_color = (45, 45, 45)  # Dark gray
-        corner_radius = self.button_height // 2  # Fully rounded corners
+        # Keep what lies under the star and button so a toggle can repaint just those areas
+        screen_rect = self.display.surface.get_rect()
+        self._favorite_backdrops = []
+        for rect in (self.star_rect, self.favorite_rect):
+            rect = rect.clip(screen_rect)
+            self._favorite_backdrops.append((self.display.surface.subsurface(rect).copy(), rect))
+        self._draw_favorite_state(self.display.surface)
         
-        # Favorite button
-        pygame.draw.rect(
-            self.display.surface,
-            (255, 165, 0) if self.current_coin.get('favorite', False) else button_color,
-            self.favorite_rect,
-            border_radius=corner_radius
-        )
-        favorite_text = "Unfavorite" if self.current_coin.get('favorite', False) else "Favorite"
-        favorite_font = self.display.get_text_font('md', 'regular')
-        favorite_surface = favorite_font.render(favorite_text, True, AppConfig.WHITE)
-        favorite_text_rect = favorite_surface.get_rect(center=self.favorite_rect.center)
-        self.display.surface.blit(favorite_surface, favorite_text_rect)
-        
-        # Delete button
-        pygame.draw.rect(
-            self.display.surface,
-            button_color,
-            self.delete_rect,
-            border_radius=corner_radius
-        )
-        delete_font = self.display.get_text_font('md', 'regular')
-        delete_surface = delete_font.render("Delete", True, AppConfig.WHITE)
-        delete_text_rect = delete_surface.get_rect(center=self.delete_rect.center)
-        self.display.surface.blit(delete_surface, delete_text_rect)
-        
-        # Back button
-        pygame.draw.rect(
-            self.display.surface,
-            button_color,
-            self.back_rect,
-            border_radius=corner_radius
-        )
-        back_font = self.display.get_text_font('md', 'regular')
-        back_surface = back_font.render("Back", True, AppConfig.WHITE)
-        back_text_rect = back_surface.get_rect(center=self.back_rect.center)
-        self.display.surface.blit(back_surface, back_text_rect)
+        # Draw buttons
+        self.display.surface.blit(self.delete_button, self.delete_rect)
+        self.display.surface.blit(self.back_button, self.back_rect)
         
         # Reset needs_redraw flag
         self.needs_redraw = False
@@ -206,11 +247,20 @@ class EditTickerScreen(BaseScreen):
     def on_screen_enter(self, coin_id: str) -> None:
         """Called when entering the screen."""
         self.load_coin(coin_id)
+        self._favorite_only = False
         self.needs_redraw = True
     
     def update(self) -> None:
         """Update screen state."""
         if self.current_coin:
-            # Refresh coin data
+            # Refresh coin data, only redrawing if a displayed field changed
+            previous = self._displayed_fields(self.current_coin)
             self.load_coin(self.current_coin['id'])
-            self.needs_redraw = True 
\ No newline at end of file
+            if self.current_coin and self._displayed_fields(self.current_coin) != previous:
+                self.needs_redraw = True
+                self._favorite_only = False
+                self.dirty_rects = []  # Name or symbol may have moved, push the full screen
+    
+    def _displayed_fields(self, coin: dict) -> tuple:
+        """Get the coin fields shown on this screen."""
+        return (coin.get('id'), coin.get('name'), coin.get('symbol'), coin.get('favorite', False)) 
\ No newline at end of file
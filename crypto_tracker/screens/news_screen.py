@@ -66,6 +66,28 @@ class NewsScreen(BaseScreen):
             self.section_height
         )
         
+        # Rendered text and wrapped lines, cleared whenever the news items change
+        self._text_cache = {}
+        self._wrap_cache = {}
+        
+        # Pre-compose the parts of the screen that never change
+        self._build_static_background()
+        
+        # Rounded background shared by every news item
+        item_width = (self.width - (self.news_item_padding * 3)) // 2  # 3 paddings: left, middle, right
+        item_height = self.news_item_height - self.news_item_padding
+        self._item_background = pygame.Surface((item_width, item_height), pygame.SRCALPHA)
+        pygame.draw.rect(
+            self._item_background,
+            (30, 30, 30, 255),  # Slightly lighter than background
+            self._item_background.get_rect(),
+            border_radius=10
+        )
+        self._item_background = self._item_background.convert_alpha()
+        
+        # Grid positions of the news items, before scrolling, grown on demand
+        self._item_positions = []
+        
         logger.info("NewsScreen initialized")
     
     def _update_news(self) -> None:
@@ -74,6 +96,8 @@ class NewsScreen(BaseScreen):
         if current_time - self.last_update_time > self.update_interval:
             self.crypto_news, self.stock_news = self.news_service.get_news()
             self.last_update_time = current_time
+            self._text_cache.clear()
+            self._wrap_cache.clear()
             logger.info("Updated news items")
             logger.info(f"Fetched {len(self.crypto_news)} crypto news and {len(self.stock_news)} stock news items")
     
@@ -117,134 +141,34 @@ class NewsScreen(BaseScreen):
             self.last_touch_y = None
             self.active_section = None
     
-    def _draw_news_item(self, item: dict, x: int, y: int, section_rect: pygame.Rect) -> pygame.Rect:
-        """Draw a single news item."""
-        # Create item rectangle within section bounds
-        item_rect = pygame.Rect(
-            x,
-            y,
-            self.news_item_width,
-            self.news_item_height
-        )
-        
-        # Only draw if item is visible within its section
-        if (y + self.news_item_height > section_rect.top and 
-            y < section_rect.bottom):
-            
-            # Draw background with gradient effect
-            gradient_colors = [(25, 25, 25), (30, 30, 30)]
-            gradient_rects = []
-            gradient_height = item_rect.height // len(gradient_colors)
-            
-            for i, color in enumerate(gradient_colors):
-                gradient_rect = pygame.Rect(
-                    item_rect.left,
-                    item_rect.top + (i * gradient_height),
-                    item_rect.width,
-                    gradient_height
-                )
-                pygame.draw.rect(
-                    self.display.surface,
-                    color,
-                    gradient_rect,
-                    border_radius=15
-                )
-                gradient_rects.append(gradient_rect)
-            
-            # Draw border
-            pygame.draw.rect(
-                self.display.surface,
-                (40, 40, 40),
-                item_rect,
-                border_radius=15,
-                width=1
-            )
-            
-            # Calculate text area
-            text_padding = 20
-            text_left = item_rect.left + text_padding
-            text_width = item_rect.width - (text_padding * 2)
-            
-            # Draw title
-            title_font = self.display.get_text_font('md', 'bold')  # Increased font size
-            title_words = item['title'].split()
-            title_lines = []
-            current_line = []
-            
-            for word in title_words:
-                test_line = ' '.join(current_line + [word])
-                test_surface = title_font.render(test_line, True, AppConfig.WHITE)
-                if test_surface.get_width() <= text_width:
-                    current_line.append(word)
-                else:
-                    if current_line:
-                        title_lines.append(' '.join(current_line))
-                    current_line = [word]
-            if current_line:
-                title_lines.append(' '.join(current_line))
-            
-            title_y = item_rect.top + text_padding
-            for line in title_lines[:2]:  # Limit to 2 lines
-                title_surface = title_font.render(line, True, AppConfig.WHITE)
-                title_rect = title_surface.get_rect(
-                    left=text_left,
-                    top=title_y
-                )
-                self.display.surface.blit(title_surface, title_rect)
-                title_y += title_font.get_height()
-            
-            # Draw source with accent color based on type
-            source_color = (45, 156, 219) if item['type'] == 'crypto' else (39, 174, 96)
-            source_font = self.display.get_text_font('sm', 'bold')  # Increased font size
-            source_text = f"{item['source']}"
-            source_surface = source_font.render(source_text, True, source_color)
-            source_rect = source_surface.get_rect(
-                left=text_left,
-                top=title_y + 10
-            )
-            self.display.surface.blit(source_surface, source_rect)
-            
-            # Draw summary if available
-            if 'summary' in item:
-                summary_font = self.display.get_text_font('sm', 'regular')  # Increased font size
-                summary_words = item['summary'].split()
-                summary_lines = []
-                current_line = []
-                
-                for word in summary_words:
-                    test_line = ' '.join(current_line + [word])
-                    test_surface = summary_font.render(test_line, True, AppConfig.GRAY)
-                    if test_surface.get_width() <= text_width:
-                        current_line.append(word)
-                    else:
-                        if current_line:
-                            summary_lines.append(' '.join(current_line))
-                        current_line = [word]
-                if current_line:
-                    summary_lines.append(' '.join(current_line))
-                
-                summary_y = source_rect.bottom + 10
-                for line in summary_lines[:2]:  # Show up to 2 lines of summary
-                    summary_surface = summary_font.render(line, True, AppConfig.GRAY)
-                    summary_rect = summary_surface.get_rect(
-                        left=text_left,
-                        top=summary_y
-                    )
-                    self.display.surface.blit(summary_surface, summary_rect)
-                    summary_y += summary_font.get_height()
-        
-        return item_rect
+    def _render_text(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """Render text, reusing the cached surface when possible."""
+        key = (font, text, color)
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            if len(self._text_cache) >= 256:  # Bound the cache between news refreshes
+                self._text_cache.clear()
+            text_surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = text_surface
+        return text_surface
     
     def _wrap_text(self, text: str, font: pygame.font.Font, max_width: int) -> list:
         """Wrap text to fit within a given width."""
+        key = (text, font, max_width)
+        lines = self._wrap_cache.get(key)
+        if lines is None:
+            lines = self._wrap_cache[key] = self._compute_wrap(text, font, max_width)
+        return lines
+    
+    def _compute_wrap(self, text: str, font: pygame.font.Font, max_width: int) -> list:
+        """Split text into lines that fit within a given width."""
         words = text.split(' ')
         lines = []
         current_line = []
         current_width = 0
         
         for word in words:
-            word_surface = font.render(word + ' ', True, AppConfig.WHITE)
-            word_width = word_surface.get_width()
+            word_width = font.size(word + ' ')[0]
             
             if current_width + word_width <= max_width:
                 current_line.append(word)
@@ -265,7 +189,7 @@ class NewsScreen(BaseScreen):
         if not news_items:
             # Draw "No news available" message
             font = self.display.get_text_font('sm', 'regular')
-            text = font.render("No news available", True, AppConfig.GRAY)
+            text = self._render_text(font, "No news available", AppConfig.GRAY)
             text_rect = text.get_rect(center=section_rect.center)
             self.display.surface.blit(text, text_rect)
             return
@@ -277,13 +201,13 @@ class NewsScreen(BaseScreen):
         item_width = (section_rect.width - (self.news_item_padding * 3)) // 2  # 3 paddings: left, middle, right
         item_height = self.news_item_height - self.news_item_padding
         
+        # Collect every item's blits and issue them in one call
+        blits = []
+        add_blit = blits.append
+        
         # Draw each news item
-        for i, item in enumerate(news_items):
-            row = i // 2
-            col = i % 2
-            
-            x = self.news_item_padding + (col * (item_width + self.news_item_padding))
-            y = (row * (item_height + self.news_item_padding)) + scroll_offset
+        for item, (x, row_y) in zip(news_items, self._get_item_positions(len(news_items))):
+            y = row_y + scroll_offset
             
             # Skip if item is not visible
             if y + item_height < 0 or y > section_rect.height:
@@ -298,12 +222,7 @@ class NewsScreen(BaseScreen):
             )
             
             # Draw item background
-            pygame.draw.rect(
-                section_surface,
-                (30, 30, 30, 255),  # Slightly lighter than background
-                item_rect,
-                border_radius=10
-            )
+            add_blit((self._item_background, item_rect))
             
             # Draw wrapped title
             title_font = self.display.get_text_font('md', 'bold')
@@ -313,24 +232,24 @@ class NewsScreen(BaseScreen):
             
             current_y = item_rect.top + 15
             for line in wrapped_title[:2]:  # Show max 2 lines
-                title_surface = title_font.render(line, True, AppConfig.WHITE)
+                title_surface = self._render_text(title_font, line, AppConfig.WHITE)
                 title_rect = title_surface.get_rect(
                     left=item_rect.left + 15,
                     top=current_y
                 )
-                section_surface.blit(title_surface, title_rect)
+                add_blit((title_surface, title_rect))
                 current_y += title_rect.height + 5  # 5px spacing between lines
             
             # Draw source with accent color
             source_color = (45, 156, 219) if item.get('type') == 'crypto' else (39, 174, 96)
             source_font = self.display.get_text_font('sm', 'bold')
             source_text = item.get('source', 'Unknown')
-            source_surface = source_font.render(source_text, True, source_color)
+            source_surface = self._render_text(source_font, source_text, source_color)
             source_rect = source_surface.get_rect(
                 left=item_rect.left + 15,
                 top=current_y + 10
             )
-            section_surface.blit(source_surface, source_rect)
+            add_blit((source_surface, source_rect))
             
             # Draw summary if available
             if 'summary' in item:
@@ -340,24 +259,40 @@ class NewsScreen(BaseScreen):
                 
                 current_y = source_rect.bottom + 10
                 for line in wrapped_summary[:2]:  # Show max 2 lines
-                    summary_surface = summary_font.render(line, True, AppConfig.GRAY)
+                    summary_surface = self._render_text(summary_font, line, AppConfig.GRAY)
                     summary_rect = summary_surface.get_rect(
                         left=item_rect.left + 15,
                         top=current_y
                     )
-                    section_surface.blit(summary_surface, summary_rect)
+                    add_blit((summary_surface, summary_rect))
                     current_y += summary_rect.height + 3  # 3px spacing between summary lines
         
+        section_surface.blits(blits, doreturn=False)
+        
         # Blit the section surface to the main display
         self.display.surface.blit(section_surface, section_rect)
     
-    def draw(self) -> None:
-        """Draw the news screen."""
-        # Update news if needed
-        self._update_news()
+    def _get_item_positions(self, count: int) -> list:
+        """Get the unscrolled (x, y) grid positions of the first count news items."""
+        positions = self._item_positions
+        if len(positions) < count:
+            item_width = self._item_background.get_width()
+            item_height = self._item_background.get_height()
+            for i in range(len(positions), count):
+                row = i // 2
+                col = i % 2
+                positions.append((
+                    self.news_item_padding + (col * (item_width + self.news_item_padding)),
+                    row * (item_height + self.news_item_padding)
+                ))
+        return positions
+    
+    def _build_static_background(self) -> None:
+        """Compose the background, section headers and divider into one surface."""
+        surface = pygame.Surface((self.width, self.height))
         
         # Fill background
-        self.display.surface.fill(self.background_color)
+        surface.fill(self.background_color)
         
         # Draw section headers with compact pill/badge design
         header_font = self.display.get_text_font('md', 'bold')  # Slightly larger font
@@ -378,12 +313,12 @@ class NewsScreen(BaseScreen):
             crypto_header_rect.height + (y_padding * 2)
         )
         pygame.draw.rect(
-            self.display.surface,
+            surface,
             (20, 62, 88),  # Darker blue background
             crypto_pill_rect,
             border_radius=crypto_pill_rect.height // 2  # Full circle corners
         )
-        self.display.surface.blit(crypto_header, crypto_header_rect)
+        surface.blit(crypto_header, crypto_header_rect)
         
         # Stock header with pill background
         stock_header = header_font.render("Stock News", True, (39, 174, 96))  # Green accent
@@ -399,12 +334,12 @@ class NewsScreen(BaseScreen):
             stock_header_rect.height + (y_padding * 2)
         )
         pygame.draw.rect(
-            self.display.surface,
+            surface,
             (16, 70, 38),  # Darker green background
             stock_pill_rect,
             border_radius=stock_pill_rect.height // 2  # Full circle corners
         )
-        self.display.surface.blit(stock_header, stock_header_rect)
+        surface.blit(stock_header, stock_header_rect)
         
         # Draw section divider with gradient
         divider_y = self.crypto_section_rect.bottom + self.section_padding // 2
@@ -414,13 +349,23 @@ class NewsScreen(BaseScreen):
         for i, color in enumerate(divider_gradient):
             y_offset = i - len(divider_gradient) // 2
             pygame.draw.line(
-                self.display.surface,
+                surface,
                 color,
                 (0, divider_y + y_offset),
                 (self.width, divider_y + y_offset),
                 divider_width
             )
         
+        self._static_background = surface.convert()
+    
+    def draw(self) -> None:
+        """Draw the news screen."""
+        # Update news if needed
+        self._update_news()
+        
+        # Draw background, section headers and divider in one blit
+        self.display.surface.blit(self._static_background, (0, 0))
+        
         # Apply scrolling physics for both sections
         self.crypto_scroll_offset += self.crypto_scroll_velocity
         self.stock_scroll_offset += self.stock_scroll_velocity
@@ -3,6 +3,7 @@
 import pygame
 import os
 import json
+from typing import Optional
 from ..config.settings import AppConfig
 from ..utils.logger import get_logger
 from .base_screen import BaseScreen
@@ -16,6 +17,10 @@ class SettingsScreen(BaseScreen):
         """Initialize the settings screen."""
         super().__init__(display)
         self.background_color = AppConfig.BLACK
+        self.text_color = AppConfig.WHITE
+        self.secondary_text_color = AppConfig.GRAY
+        self.logo_dir = AppConfig.CACHE_DIR
+        self.finger_down_event = AppConfig.EVENT_TYPES['FINGER_DOWN']
         
         # Header dimensions
         self.header_height = 80
@@ -28,6 +33,16 @@ class SettingsScreen(BaseScreen):
         self.cell_spacing = 15
         self.corner_radius = 10
         
+        # Pre-render the rounded cell background in the display pixel format
+        cell_surface = pygame.Surface((self.cell_width, self.cell_height), pygame.SRCALPHA)
+        pygame.draw.rect(
+            cell_surface,
+            (30, 30, 30),
+            cell_surface.get_rect(),
+            border_radius=self.corner_radius
+        )
+        self._cell_surface = cell_surface.convert_alpha()
+        
         # Button dimensions
         self.button_width = 120  # Smaller width for Add Coin button
         self.button_height = 40
@@ -36,9 +51,79 @@ class SettingsScreen(BaseScreen):
         self.coins_per_page = 6
         self.current_page = 0
         
-        # Initialize tracked coins list and click areas
+        # Add button in top right
+        self.add_button_rect = pygame.Rect(
+            self.width - self.button_width - self.padding,
+            self.padding,
+            self.button_width,
+            self.button_height
+        )
+        
+        # Rendered text cache, keyed by (text, size, style, color)
+        self._text_cache = {}
+        
+        # Pre-render static labels
+        header_font = self.display.get_title_font('md')
+        self._header_surface = header_font.render("My Settings", True, self.text_color)
+        self._header_rect = self._header_surface.get_rect(
+            left=self.padding,
+            top=self.padding
+        )
+        add_font = self.display.get_text_font('md', 'regular')
+        self._add_surface = add_font.render("Add Coin", True, self.text_color)
+        self._add_rect = self._add_surface.get_rect(center=self.add_button_rect.center)
+        
+        # Pre-compose the static background, header and add button
+        self._build_static_background()
+        
+        # Cell rects and edit icon touch areas for each cell slot on a page
+        self._cell_rects = self._create_cell_rects()
+        self._page_backgrounds = {}  # Static background plus cell chrome, keyed by occupied slots
+        
+        # Fully composed page, rebuilt when the coins or the shown page change
+        self._page_surface = pygame.Surface((self.width, self.height)).convert()
+        self._composed_page = None  # Page index held by _page_surface, None when stale
+        
+        # Grid origin, cell pitch and outer bounds used for touch hit tests
+        self._grid_left = self.padding
+        self._grid_top = self.header_height + self.padding
+        self._cell_pitch_x = self.cell_width + self.padding
+        self._cell_pitch_y = self.cell_height + self.cell_spacing
+        self._grid_right = self._grid_left + self.columns * self._cell_pitch_x
+        self._grid_bottom = self._grid_top + (self.coins_per_page // self.columns) * self._cell_pitch_y
+        self.edit_touch_size = 60
+        self._edit_touch_rects = self._create_edit_touch_rects()
+        
+        # Load the edit icon once and center it within its touch area
+        self._edit_icon = self.assets.get_icon('edit', size=(48, 48))
+        if self._edit_icon:
+            self._edit_icon = self._edit_icon.convert_alpha()
+            self._edit_icon_offset = (
+                self.cell_width - 10 - self.edit_touch_size // 2 - self._edit_icon.get_width() // 2,
+                self.cell_height // 2 - self._edit_icon.get_height() // 2
+            )
+        
+        # Text and logo offsets within a cell, fixed by the font metrics
+        name_height = self.display.get_text_font('md', 'regular').get_height()
+        symbol_height = self.display.get_text_font('sm', 'regular').get_height()
+        self._name_y_offset = self.cell_height // 2 - (name_height + symbol_height + 5) // 2
+        self._symbol_y_offset = self._name_y_offset + name_height + 5
+        self._logo_y_offset = (self.cell_height - 32) // 2
+        
+        # Favorite star is tinted once and centered on the name line
+        self._star_icon = self.assets.get_icon('star', size=(24, 24), color=(255, 165, 0))
+        if self._star_icon:
+            self._star_icon = self._star_icon.convert_alpha()
+            self._star_y_offset = self._name_y_offset + name_height // 2 - self._star_icon.get_height() // 2
+        
+        # Scaled coin logos as (file mtime, surface), keyed by logo path
+        self._logo_cache = {}
+        
+        # Initialize tracked coins list
         self.tracked_coins = []
-        self.edit_icon_areas = []  # Store edit icon rects and associated coins
+        self._cell_labels = []  # (name, symbol) display strings per tracked coin, None for invalid entries
+        self._cell_logos = []  # Scaled logo per tracked coin, None when missing
+        self._coins_signature = None  # Content signature of the last loaded coin list
         
         # Load tracked coins
         self.load_tracked_coins()
@@ -48,116 +133,243 @@ class SettingsScreen(BaseScreen):
     def on_screen_enter(self) -> None:
         """Called when entering the screen."""
         logger.info("Refreshing tracked coins list")
-        self.load_tracked_coins()
+        if not self.load_tracked_coins():
+            self._refresh_cell_logos()  # Pick up logo files that changed since the last visit
         self.needs_redraw = True  # Let the screen manager handle the redraw
     
     def update(self) -> None:
         """Update screen state."""
-        # Refresh tracked coins periodically
-        self.load_tracked_coins()
-        self.needs_redraw = True
+        # Refresh tracked coins periodically, only redrawing if the list changed
+        previous_signature = self._coins_signature
+        full_redraw_pending = self.needs_redraw
+        if not self.load_tracked_coins():
+            return
+        
+        changed_rects = self._changed_cell_rects(previous_signature, self._coins_signature)
+        if changed_rects is None or (changed_rects and full_redraw_pending):
+            # Never narrow a full redraw that is already queued, e.g. after a page swipe
+            self.needs_redraw = True
+            self.dirty_rects = []
+        elif changed_rects:
+            self.needs_redraw = True
+            self.dirty_rects = changed_rects
     
-    def load_tracked_coins(self) -> None:
-        """Load tracked coins using crypto manager."""
-        self.tracked_coins = self.crypto_manager.get_tracked_coins()
+    def _changed_cell_rects(self, old: Optional[tuple], new: tuple) -> Optional[list]:
+        """
+        Get the rects of the cells on the current page whose coin changed.
+        
+        Returns:
+            None if the whole screen needs to be pushed, otherwise the changed cell rects
+        """
+        # Coin count changes can move every cell and the page indicator
+        if old is None or len(old) != len(new) or len(new) != len(self.tracked_coins):
+            return None
+        
+        start_index = self.current_page * self.coins_per_page
+        return [
+            rect
+            for rect, old_coin, new_coin in zip(
+                self._cell_rects,
+                old[start_index:start_index + self.coins_per_page],
+                new[start_index:start_index + self.coins_per_page]
+            )
+            if old_coin != new_coin
+        ]
     
-    def _draw_coin_cell(self, surface: pygame.Surface, x: int, y: int, coin: dict) -> tuple:
-        """Draw a coin cell and return its rect and edit icon rect."""
-        # Draw cell background
-        rect = pygame.Rect(x, y, self.cell_width, self.cell_height)
-        pygame.draw.rect(surface, (30, 30, 30), rect, border_radius=self.corner_radius)
+    def load_tracked_coins(self) -> bool:
+        """
+        Load tracked coins using crypto manager.
         
-        # Load coin logo if available
-        logo = None
-        logo_path = os.path.join(AppConfig.CACHE_DIR, f"{coin['symbol'].lower()}_logo.png")
-        if os.path.exists(logo_path):
-            try:
-                logo = pygame.image.load(logo_path)
-                logo = pygame.transform.scale(logo, (32, 32))
-            except Exception as e:
-                logger.error(f"Error loading logo for {coin['symbol']}: {e}")
+        Returns:
+            True if the displayed coin data changed since the last load
+        """
+        coins = self.crypto_manager.get_tracked_coins()
         
-        # Calculate text start position
-        text_start_x = x + 15
-        if logo:
-            surface.blit(logo, (x + 15, y + (self.cell_height - 32) // 2))
-            text_start_x = x + 60
+        # Only the fields shown on this screen take part in the signature
+        signature = tuple(
+            (coin.get('id'), coin.get('symbol'), coin.get('name'), coin.get('favorite', False))
+            for coin in coins if isinstance(coin, dict)
+        )
+        if signature == self._coins_signature:
+            return False
+        
+        self._coins_signature = signature
+        self.tracked_coins = coins
+        self._cell_labels = [
+            self._create_cell_label(coin) if isinstance(coin, dict) else None
+            for coin in coins
+        ]
+        self._refresh_cell_logos()
+        self._text_cache.clear()
+        return True
+    
+    def _create_cell_rects(self) -> list:
+        """Create the rect of every cell slot on a page."""
+        rects = []
+        for i in range(self.coins_per_page):
+            column = i % self.columns
+            row = i // self.columns
+            x = self.padding + (column * (self.cell_width + self.padding))
+            y = self.header_height + self.padding + (row * (self.cell_height + self.cell_spacing))
+            rects.append(pygame.Rect(x, y, self.cell_width, self.cell_height))
+        return rects
+    
+    def _create_edit_touch_rects(self) -> list:
+        """Create the edit icon touch area for every cell slot on a page."""
+        return [
+            pygame.Rect(
+                rect.right - self.edit_touch_size - 10,  # 10px from right edge
+                rect.top + (self.cell_height - self.edit_touch_size) // 2,
+                self.edit_touch_size,
+                self.edit_touch_size
+            )
+            for rect in self._cell_rects
+        ]
+    
+    def _slot_at(self, x: int, y: int) -> Optional[int]:
+        """Get the index of the cell slot containing a point, if any."""
+        if not (self._grid_left <= x < self._grid_right and self._grid_top <= y < self._grid_bottom):
+            return None
+        
+        column, offset_x = divmod(x - self._grid_left, self._cell_pitch_x)
+        row, offset_y = divmod(y - self._grid_top, self._cell_pitch_y)
+        
+        # Reject points in the gaps between cells
+        if offset_x >= self.cell_width or offset_y >= self.cell_height:
+            return None
+        
+        return row * self.columns + column
+    
+    def _build_static_background(self) -> None:
+        """Compose the parts of the screen that never change into one surface."""
+        self._static_background = pygame.Surface((self.width, self.height))
+        self._static_background.fill(self.background_color)
+        
+        # Header
+        self._static_background.blit(self._header_surface, self._header_rect)
         
-        # Calculate total height of name + symbol for centering
+        # Add button
+        pygame.draw.rect(
+            self._static_background,
+            (45, 45, 45),
+            self.add_button_rect,
+            border_radius=10
+        )
+        self._static_background.blit(self._add_surface, self._add_rect)
+        self._static_background = self._static_background.convert()
+    
+    def _get_page_background(self, occupied: tuple) -> pygame.Surface:
+        """Get the static background with cell backgrounds drawn into the occupied slots."""
+        background = self._page_backgrounds.get(occupied)
+        if background is None:
+            background = self._static_background.copy()
+            for rect, filled in zip(self._cell_rects, occupied):
+                if filled:
+                    background.blit(self._cell_surface, rect)
+            background = background.convert()
+            self._page_backgrounds[occupied] = background
+        return background
+    
+    def _render_text(self, text: str, size: str, style: str, color: tuple) -> pygame.Surface:
+        """Render text with a text font, reusing the cached surface when possible."""
+        key = (text, size, style, color)
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            font = self.display.get_text_font(size, style)
+            text_surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = text_surface
+        return text_surface
+    
+    def _get_logo(self, symbol: str) -> Optional[pygame.Surface]:
+        """Get the scaled logo for a coin, only reading the file again when it changed on disk."""
+        logo_path = os.path.join(self.logo_dir, f"{symbol.lower()}_logo.png")
+        try:
+            mtime = os.stat(logo_path).st_mtime_ns
+        except OSError:
+            return None
+        
+        cached = self._logo_cache.get(logo_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        logo = None
+        try:
+            logo = pygame.image.load(logo_path)
+            logo = pygame.transform.scale(logo, (32, 32)).convert_alpha()
+        except Exception as e:
+            logger.error(f"Error loading logo for {symbol}: {e}")
+        self._logo_cache[logo_path] = (mtime, logo)
+        return logo
+    
+    def _create_cell_label(self, coin: dict) -> tuple:
+        """Get the name and symbol text shown in a coin's cell."""
         name_text = coin.get('name', '')
         if len(name_text) > 15:  # Truncate long names
             name_text = name_text[:13] + '...'
-        name_font = self.display.get_text_font('md', 'regular')
-        name_surface = name_font.render(name_text, True, AppConfig.WHITE)
+        return name_text, coin.get('symbol', '').upper()
+    
+    def _refresh_cell_logos(self) -> None:
+        """Resolve the logo of every tracked coin so drawing never touches the disk."""
+        self._cell_logos = [
+            self._get_logo(coin['symbol']) if label is not None else None
+            for coin, label in zip(self.tracked_coins, self._cell_labels)
+        ]
+        self._composed_page = None
+    
+    def _draw_coin_cell(self, blits: list, rect: pygame.Rect, label: tuple, logo: Optional[pygame.Surface], is_favorite: bool) -> None:
+        """Queue the blits that draw a coin cell into the given cell rect."""
+        x, y = rect.x, rect.y
+        add_blit = blits.append
+        render_text = self._render_text
         
-        symbol_text = coin.get('symbol', '').upper()
-        symbol_font = self.display.get_text_font('sm', 'regular')
-        symbol_surface = symbol_font.render(symbol_text, True, AppConfig.GRAY)
+        # Calculate text start position
+        text_start_x = x + 15
+        if logo:
+            add_blit((logo, (x + 15, y + self._logo_y_offset)))
+            text_start_x = x + 60
         
-        total_text_height = name_surface.get_height() + symbol_surface.get_height() + 5
-        text_start_y = rect.centery - (total_text_height // 2)
+        name_text, symbol_text = label
+        name_surface = render_text(name_text, 'md', 'regular', self.text_color)
+        symbol_surface = render_text(symbol_text, 'sm', 'regular', self.secondary_text_color)
         
-        # Draw coin name
-        name_rect = name_surface.get_rect(
-            left=text_start_x,
-            top=text_start_y
-        )
-        surface.blit(name_surface, name_rect)
+        # Draw coin name, name and symbol are centered as a block using the precomputed offsets
+        add_blit((name_surface, (text_start_x, y + self._name_y_offset)))
         
         # Draw star if favorited
-        if coin.get('favorite', False):
-            star_icon = self.assets.get_icon('star', size=(24, 24), color=(255, 165, 0))
-            if star_icon:
-                star_rect = star_icon.get_rect(
-                    left=name_rect.right + 10,
-                    centery=name_rect.centery
-                )
-                surface.blit(star_icon, star_rect)
+        if self._star_icon and is_favorite:
+            add_blit((self._star_icon, (text_start_x + name_surface.get_width() + 10, y + self._star_y_offset)))
         
         # Draw symbol
-        symbol_rect = symbol_surface.get_rect(
-            left=text_start_x,
-            top=name_rect.bottom + 5
-        )
-        surface.blit(symbol_surface, symbol_rect)
-        
-        # Draw edit icon (larger)
-        edit_icon = self.assets.get_icon('edit', size=(48, 48))  # Increased from 32 to 48
-        if edit_icon:
-            # Create a larger touch area for the edit icon
-            edit_touch_size = 60  # Even larger touch area
-            edit_icon_rect = pygame.Rect(
-                rect.right - edit_touch_size - 10,  # 10px from right edge
-                rect.centery - edit_touch_size // 2,
-                edit_touch_size,
-                edit_touch_size
-            )
-            
-            # Center the icon within its touch area
-            icon_x = edit_icon_rect.centerx - edit_icon.get_width() // 2
-            icon_y = edit_icon_rect.centery - edit_icon.get_height() // 2
-            surface.blit(edit_icon, (icon_x, icon_y))
-        else:
-            edit_icon_rect = None
+        add_blit((symbol_surface, (text_start_x, y + self._symbol_y_offset)))
         
-        return rect, edit_icon_rect, coin
+        # Draw edit icon
+        if self._edit_icon:
+            add_blit((self._edit_icon, (x + self._edit_icon_offset[0], y + self._edit_icon_offset[1])))
+    
+    def _total_pages(self) -> int:
+        """Get the number of pages needed for the tracked coins."""
+        return (len(self.tracked_coins) + self.coins_per_page - 1) // self.coins_per_page
     
     def next_page(self):
         """Move to next page of coins."""
-        total_pages = (len(self.tracked_coins) + self.coins_per_page - 1) // self.coins_per_page
+        total_pages = self._total_pages()
         if total_pages > 0:
             self.current_page = (self.current_page + 1) % total_pages
+            self.needs_redraw = True
             logger.info(f"Moved to page {self.current_page + 1} of {total_pages}")
     
     def previous_page(self):
         """Move to previous page of coins."""
-        total_pages = (len(self.tracked_coins) + self.coins_per_page - 1) // self.coins_per_page
+        total_pages = self._total_pages()
         if total_pages > 0:
             self.current_page = (self.current_page - 1) % total_pages
+            self.needs_redraw = True
             logger.info(f"Moved to page {self.current_page + 1} of {total_pages}")
     
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handle pygame events."""
+        # Any change made while handling input is pushed as a full screen
+        self.dirty_rects = []
         gestures = self.gesture_handler.handle_touch_event(event)
         
         if gestures['swipe_down']:
@@ -169,7 +381,7 @@ class SettingsScreen(BaseScreen):
         elif gestures['swipe_right']:
             logger.info("Swipe right detected, showing previous page")
             self.previous_page()
-        elif event.type == AppConfig.EVENT_TYPES['FINGER_DOWN']:
+        elif event.type == self.finger_down_event:
             x, y = self._scale_touch_input(event)
             
             # Check add button first
@@ -178,78 +390,56 @@ class SettingsScreen(BaseScreen):
                 self.screen_manager.switch_screen('add_ticker')
                 return
             
-            # Check edit icons
-            for edit_rect, coin in self.edit_icon_areas:
-                if edit_rect.collidepoint(x, y):
+            # Check the edit icon of the cell under the touch
+            slot = self._slot_at(x, y)
+            if slot is None or not self._edit_touch_rects[slot].collidepoint(x, y):
+                return
+            
+            coin_index = self.current_page * self.coins_per_page + slot
+            if coin_index < len(self.tracked_coins):
+                coin = self.tracked_coins[coin_index]
+                if isinstance(coin, dict):
                     logger.info(f"Edit icon clicked for {coin['symbol']}")
                     self.screen_manager.switch_screen('edit_ticker', coin_id=coin['id'])
-                    return
     
     def draw(self) -> None:
         """Draw the settings screen."""
-        # Fill background
-        self.display.surface.fill(self.background_color)
-        
-        # Draw header
-        header_text = "My Settings"
-        header_font = self.display.get_title_font('md')
-        header_surface = header_font.render(header_text, True, AppConfig.WHITE)
-        header_rect = header_surface.get_rect(
-            left=self.padding,
-            top=self.padding
-        )
-        self.display.surface.blit(header_surface, header_rect)
-        
-        # Draw add button in top right
-        self.add_button_rect = pygame.Rect(
-            self.width - self.button_width - self.padding,
-            self.padding,
-            self.button_width,
-            self.button_height
-        )
-        
-        pygame.draw.rect(
-            self.display.surface,
-            (45, 45, 45),
-            self.add_button_rect,
-            border_radius=10
-        )
-        
-        add_text = "Add Coin"
-        add_font = self.display.get_text_font('md', 'regular')
-        add_surface = add_font.render(add_text, True, AppConfig.WHITE)
-        add_rect = add_surface.get_rect(center=self.add_button_rect.center)
-        self.display.surface.blit(add_surface, add_rect)
+        if self._composed_page != self.current_page:
+            self._compose_page()
+            self._composed_page = self.current_page
+        self.display.surface.blit(self._page_surface, (0, 0))
+    
+    def _compose_page(self) -> None:
+        """Draw the current page of coins into the composed page surface."""
+        surface = self._page_surface
+        tracked_coins = self.tracked_coins
         
         # Draw tracked coins in a grid with pagination
         start_index = self.current_page * self.coins_per_page
-        end_index = min(start_index + self.coins_per_page, len(self.tracked_coins))
-        current_y = self.header_height + self.padding
-        
-        self.coin_rects = []  # Store rects for click detection
-        self.edit_icon_areas = []  # Reset edit icon areas
-        
-        for i, coin in enumerate(self.tracked_coins[start_index:end_index]):
-            if isinstance(coin, dict):
-                column = i % self.columns
-                x = self.padding + (column * (self.cell_width + self.padding))
-                
-                if column == 0 and i > 0:
-                    current_y += self.cell_height + self.cell_spacing
-                
-                rect, edit_icon_rect, coin = self._draw_coin_cell(self.display.surface, x, current_y, coin)
-                self.coin_rects.append((rect, coin))
-                if edit_icon_rect:
-                    self.edit_icon_areas.append((edit_icon_rect, coin))
+        end_index = start_index + self.coins_per_page
+        page_coins = tracked_coins[start_index:end_index]
+        page_labels = self._cell_labels[start_index:end_index]
+        page_logos = self._cell_logos[start_index:end_index]
+        
+        # Draw background, header, add button and cell backgrounds in one blit
+        occupied = tuple(label is not None for label in page_labels)
+        surface.blit(self._get_page_background(occupied), (0, 0))
+        
+        # Collect every cell's blits and issue them in one call
+        blits = []
+        draw_cell = self._draw_coin_cell
+        for rect, coin, label, logo in zip(self._cell_rects, page_coins, page_labels, page_logos):
+            if label is not None:
+                draw_cell(blits, rect, label, logo, coin.get('favorite', False))
+        surface.blits(blits, doreturn=False)
         
         # Draw page indicator
-        total_pages = (len(self.tracked_coins) + self.coins_per_page - 1) // self.coins_per_page
+        total_pages = self._total_pages()
         if total_pages > 1:
             page_text = f"Page {self.current_page + 1} of {total_pages}"
-            page_font = self.display.get_text_font('md', 'regular')
-            page_surface = page_font.render(page_text, True, AppConfig.GRAY)
+            page_surface = self._render_text(page_text, 'md', 'regular', self.secondary_text_color)
             page_rect = page_surface.get_rect(
                 centerx=self.width // 2,
                 bottom=self.height - self.padding
             )
-            self.display.surface.blit(page_surface, page_rect) 
\ No newline at end of file
+            surface.blit(page_surface, page_rect) 
\ No newline at end of file
@@ -2,6 +2,8 @@
 
 import pygame
 import os
+import numpy as np
+from typing import Optional
 from ..config.settings import AppConfig
 from ..utils.logger import get_logger
 from .base_screen import BaseScreen
@@ -43,6 +45,41 @@ class TickerScreen(BaseScreen):
         self.showing_selector = False
         self.selector_start_time = 0
         self.selector_scroll_offset = 0  # Horizontal scroll offset for selector
+        self.selector_logo_size = 60
+        self.selector_spacing = 25
+        
+        # Semi-transparent dark overlay drawn behind the selector
+        self.selector_overlay = self._get_overlay((0, 0, 0, 230))  # Very dark, almost black background
+        self.glow_surfaces = {}  # Glow drawn behind the current selector item, keyed by item size
+        self.item_backgrounds = {}  # Rounded background of a selector item, keyed by item size
+        
+        # Favorite star is tinted once instead of on every draw
+        self.star_icon = self.assets.get_icon('star', size=(24, 24), color=(255, 165, 0))
+        if self.star_icon:
+            self.star_icon = self.star_icon.convert_alpha()
+        
+        # Trend icons keyed by whether the price went up, tinted to match the change text
+        self.trend_icons = {}
+        for is_up, name, color in ((True, 'trending-up', AppConfig.GREEN), (False, 'trending-down', AppConfig.RED)):
+            icon = self.assets.get_icon(name, size=(32, 32), color=color)
+            self.trend_icons[is_up] = icon.convert_alpha() if icon else None
+        
+        # Scaled coin logos keyed by (symbol, size), None when a coin has no usable logo
+        self.logo_cache = {}
+        self._logo_symbols = None
+        
+        # Rendered text keyed by (font, text, color)
+        self.text_cache = {}
+        
+        # Data shown by the last redraw triggered from update()
+        self._display_state = None
+        
+        # Clickable selector items as (coin index, rect), rebuilt when the coin list changes
+        self._selector_rects = []
+        self._selector_crypto_count = 0  # Crypto items come first in _selector_rects
+        self._selector_boxes = np.empty((0, 4), dtype=np.int32)  # (x, y, w, h) rows for hit-testing
+        self._selector_indices = []  # Coin index of each row in _selector_boxes
+        self._selector_layout_key = None
         
         # Load initial coin data
         self.refresh_coins()
@@ -54,11 +91,84 @@ class TickerScreen(BaseScreen):
         self.coins = self.crypto_manager.get_tracked_coins()
         if self.coins and self.current_index >= len(self.coins):
             self.current_index = 0
+        
+        # Reload logos when the tracked coins change so newly cached logo files are picked up
+        symbols = tuple(coin.get('symbol') for coin in self.coins)
+        if symbols != self._logo_symbols:
+            self._logo_symbols = symbols
+            self.logo_cache.clear()
+        
+        # Selector positions only depend on each coin's type and order
+        layout_key = tuple(coin.get('type', '') == 'stock' for coin in self.coins)
+        if layout_key != self._selector_layout_key:
+            self._selector_layout_key = layout_key
+            self._rebuild_selector_rects()
+    
+    def _rebuild_selector_rects(self) -> None:
+        """Precompute the clickable area of every item in the ticker selector."""
+        logo_size = self.selector_logo_size
+        spacing = self.selector_spacing
+        row_width = self.width - 80
+        logos_per_row = max(1, (row_width + spacing) // (logo_size + spacing))
+        
+        crypto_indices = [i for i, coin in enumerate(self.coins) if coin.get('type', '') != 'stock']
+        stock_indices = [i for i, coin in enumerate(self.coins) if coin.get('type', '') == 'stock']
+        
+        self._selector_crypto_count = len(crypto_indices)
+        self._selector_rects = []
+        for section_y, indices in ((self.height * 0.25, crypto_indices), (self.height * 0.65, stock_indices)):
+            for i, coin_index in enumerate(indices):
+                row, col = divmod(i, logos_per_row)
+                logo_x = 40 + col * (logo_size + spacing)
+                logo_y = section_y + row * (logo_size + spacing)
+                
+                # Include symbol text height in clickable area
+                self._selector_rects.append(
+                    (coin_index, pygame.Rect(logo_x, logo_y, logo_size, logo_size + 30))
+                )
+        
+        # Same rects as parallel arrays so a touch is resolved without a Python loop
+        self._selector_indices = [coin_index for coin_index, _ in self._selector_rects]
+        self._selector_boxes = np.array(
+            [tuple(rect) for _, rect in self._selector_rects],
+            dtype=np.int32
+        ).reshape(-1, 4)
+    
+    def _selector_item_at(self, x: int, y: int) -> Optional[int]:
+        """Get the coin index of the selector item under a point, if any."""
+        boxes = self._selector_boxes
+        left, top = boxes[:, 0], boxes[:, 1]
+        hits = (left <= x) & (x < left + boxes[:, 2]) & (top <= y) & (y < top + boxes[:, 3])
+        if not hits.any():
+            return None
+        return self._selector_indices[int(hits.argmax())]
     
     def update(self) -> None:
         """Update screen state."""
         self.refresh_coins()
-        self.needs_redraw = True
+        
+        # Only redraw when data shown on screen changed
+        display_state = self._get_display_state()
+        if display_state != self._display_state:
+            self._display_state = display_state
+            self.needs_redraw = True
+    
+    def _get_display_state(self) -> tuple:
+        """Get the coin data drawn on screen, used to detect changes."""
+        if not self.coins:
+            return ()
+        
+        coin = self.coins[self.current_index]
+        return (
+            self._logo_symbols,
+            self._selector_layout_key,
+            self.current_index,
+            coin.get('name'),
+            coin.get('current_price'),
+            coin.get('price_change_24h'),
+            coin.get('favorite', False),
+            tuple(coin.get('sparkline_7d') or ())
+        )
     
     def next_coin(self):
         """Switch to next coin."""
@@ -78,57 +188,12 @@ class TickerScreen(BaseScreen):
             x, y = self._scale_touch_input(event)
             
             if self.showing_selector:
-                # Define the same layout parameters as in draw_ticker_selector
-                logo_size = 60
-                spacing = 25
-                crypto_section_y = self.height * 0.25
-                stock_section_y = self.height * 0.65
-                
-                # Split coins into sections
-                cryptos = [coin for coin in self.coins if coin.get('type', '') != 'stock']
-                stocks = [coin for coin in self.coins if coin.get('type', '') == 'stock']
-                
-                # Check crypto section
-                if cryptos:
-                    row_width = self.width - 80
-                    logos_per_row = max(1, (row_width + spacing) // (logo_size + spacing))
-                    
-                    for i, coin in enumerate(cryptos):
-                        row = i // logos_per_row
-                        col = i % logos_per_row
-                        
-                        logo_x = 40 + col * (logo_size + spacing)
-                        logo_y = crypto_section_y + row * (logo_size + spacing)
-                        
-                        # Include symbol text height in clickable area
-                        logo_rect = pygame.Rect(logo_x, logo_y, logo_size, logo_size + 30)
-                        
-                        if logo_rect.collidepoint(x, y):
-                            self.current_index = self.coins.index(coin)
-                            self.showing_selector = False
-                            self.needs_redraw = True
-                            return
-                
-                # Check stock section
-                if stocks:
-                    row_width = self.width - 80
-                    logos_per_row = max(1, (row_width + spacing) // (logo_size + spacing))
-                    
-                    for i, coin in enumerate(stocks):
-                        row = i // logos_per_row
-                        col = i % logos_per_row
-                        
-                        logo_x = 40 + col * (logo_size + spacing)
-                        logo_y = stock_section_y + row * (logo_size + spacing)
-                        
-                        # Include symbol text height in clickable area
-                        logo_rect = pygame.Rect(logo_x, logo_y, logo_size, logo_size + 30)
-                        
-                        if logo_rect.collidepoint(x, y):
-                            self.current_index = self.coins.index(coin)
-                            self.showing_selector = False
-                            self.needs_redraw = True
-                            return
+                coin_index = self._selector_item_at(x, y)
+                if coin_index is not None:
+                    self.current_index = coin_index
+                    self.showing_selector = False
+                    self.needs_redraw = True
+                    return
                 
                 # Hide selector if clicked outside
                 self.showing_selector = False
@@ -156,127 +221,132 @@ class TickerScreen(BaseScreen):
         if not self.showing_selector:
             return
             
-        # Create semi-transparent dark overlay for background
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 230))  # Very dark, almost black background
-        self.display.surface.blit(overlay, (0, 0))
+        # Bind the values shared by every item once
+        surface = self.display.surface
+        symbol_font = self.display.get_text_font('sm', 'regular')
+        coins = self.coins
+        current_index = self.current_index
+        draw_item = self._draw_selector_item
         
-        # Define sizes and spacing
-        logo_size = 60
-        spacing = 25
-        section_spacing = 60
+        # Draw semi-transparent dark overlay for background
+        surface.blit(self.selector_overlay, (0, 0))
         
-        # Split coins into crypto and stocks
-        cryptos = [coin for coin in self.coins if coin.get('type', '') != 'stock']
-        stocks = [coin for coin in self.coins if coin.get('type', '') == 'stock']
+        logo_size = self.selector_logo_size
         
-        # Calculate layout
-        crypto_section_y = self.height * 0.25  # Start crypto section at 25% of screen height
-        stock_section_y = self.height * 0.65   # Start stock section at 65% of screen height
+        # Item positions are precomputed, crypto items first, then stocks
+        crypto_count = self._selector_crypto_count
+        sections = (
+            ("CRYPTO", self.height * 0.25, self._selector_rects[:crypto_count]),  # Start crypto section at 25% of screen height
+            ("STOCKS", self.height * 0.65, self._selector_rects[crypto_count:])   # Start stock section at 65% of screen height
+        )
         
         # Draw section headers
         header_font = self.display.get_title_font('md', 'bold')
         label_font = self.display.get_text_font('sm', 'regular')
         
-        # Crypto section
-        if cryptos:
-            # Draw "CRYPTO" header
-            header_surface = header_font.render("CRYPTO", True, AppConfig.WHITE)
-            header_rect = header_surface.get_rect(
-                left=40,
-                bottom=crypto_section_y - 20
-            )
-            self.display.surface.blit(header_surface, header_rect)
+        for title, section_y, items in sections:
+            if not items:
+                continue
             
-            # Draw crypto count
-            count_text = f"{len(cryptos)} {'asset' if len(cryptos) == 1 else 'assets'}"
-            count_surface = label_font.render(count_text, True, (128, 128, 128))
-            count_rect = count_surface.get_rect(
-                left=header_rect.right + 15,
-                centery=header_rect.centery
-            )
-            self.display.surface.blit(count_surface, count_rect)
-            
-            # Draw crypto logos
-            row_width = self.width - 80  # 40px padding on each side
-            logos_per_row = max(1, (row_width + spacing) // (logo_size + spacing))
-            
-            for i, coin in enumerate(cryptos):
-                row = i // logos_per_row
-                col = i % logos_per_row
-                
-                x = 40 + col * (logo_size + spacing)
-                y = crypto_section_y + row * (logo_size + spacing)
-                
-                self._draw_selector_item(coin, x, y, logo_size)
-        
-        # Stock section
-        if stocks:
-            # Draw "STOCKS" header
-            header_surface = header_font.render("STOCKS", True, AppConfig.WHITE)
+            # Draw section header
+            header_surface = self._render_text(header_font, title, AppConfig.WHITE)
             header_rect = header_surface.get_rect(
                 left=40,
-                bottom=stock_section_y - 20
+                bottom=section_y - 20
             )
-            self.display.surface.blit(header_surface, header_rect)
+            surface.blit(header_surface, header_rect)
             
-            # Draw stock count
-            count_text = f"{len(stocks)} {'asset' if len(stocks) == 1 else 'assets'}"
-            count_surface = label_font.render(count_text, True, (128, 128, 128))
+            # Draw section count
+            count_text = f"{len(items)} {'asset' if len(items) == 1 else 'assets'}"
+            count_surface = self._render_text(label_font, count_text, (128, 128, 128))
             count_rect = count_surface.get_rect(
                 left=header_rect.right + 15,
                 centery=header_rect.centery
             )
-            self.display.surface.blit(count_surface, count_rect)
-            
-            # Draw stock logos
-            row_width = self.width - 80  # 40px padding on each side
-            logos_per_row = max(1, (row_width + spacing) // (logo_size + spacing))
+            surface.blit(count_surface, count_rect)
             
-            for i, coin in enumerate(stocks):
-                row = i // logos_per_row
-                col = i % logos_per_row
-                
-                x = 40 + col * (logo_size + spacing)
-                y = stock_section_y + row * (logo_size + spacing)
-                
-                self._draw_selector_item(coin, x, y, logo_size)
+            # Draw section logos
+            for coin_index, item_rect in items:
+                draw_item(surface, symbol_font, coins[coin_index], item_rect.x, item_rect.y,
+                          logo_size, coin_index == current_index)
     
-    def _draw_selector_item(self, coin, x, y, size):
-        """Draw a single item in the selector with logo and hover effects."""
-        is_current = coin == self.coins[self.current_index]
-        logo_path = os.path.join(AppConfig.CACHE_DIR, f"{coin['symbol'].lower()}_logo.png")
+    def _get_glow_surface(self, size: int) -> pygame.Surface:
+        """Get the glow drawn behind the current selector item, rendering it once per size."""
+        glow_surface = self.glow_surfaces.get(size)
+        if glow_surface is None:
+            glow_surface = pygame.Surface((size + 20, size + 20), pygame.SRCALPHA)
+            for radius in range(10, 0, -2):
+                alpha = int(60 * (radius / 10))
+                pygame.draw.circle(glow_surface, (255, 255, 255, alpha), 
+                                (size//2 + 10, size//2 + 10), size//2 + radius)
+            glow_surface = glow_surface.convert_alpha()
+            self.glow_surfaces[size] = glow_surface
+        return glow_surface
+    
+    def _get_item_background(self, size: int) -> pygame.Surface:
+        """Get the rounded background drawn behind a selector logo, rendering it once per size."""
+        item_background = self.item_backgrounds.get(size)
+        if item_background is None:
+            item_background = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.rect(item_background, (30, 30, 30), item_background.get_rect(), border_radius=15)
+            item_background = item_background.convert_alpha()
+            self.item_backgrounds[size] = item_background
+        return item_background
+    
+    def _render_text(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """Render text, reusing the cached surface when possible."""
+        key = (font, text, color)
+        text_surface = self.text_cache.get(key)
+        if text_surface is None:
+            if len(self.text_cache) >= 256:  # Prices keep changing, drop stale renders
+                self.text_cache.clear()
+            text_surface = font.render(text, True, color).convert_alpha()
+            self.text_cache[key] = text_surface
+        return text_surface
+    
+    def _get_logo(self, symbol: str, size: int) -> Optional[pygame.Surface]:
+        """Get a coin logo scaled to the given size, loading it from disk only once."""
+        key = (symbol, size)
+        if key in self.logo_cache:
+            return self.logo_cache[key]
         
+        logo = None
+        logo_path = os.path.join(AppConfig.CACHE_DIR, f"{symbol.lower()}_logo.png")
         if os.path.exists(logo_path):
+            try:
+                logo = pygame.image.load(logo_path)
+                logo = pygame.transform.scale(logo, (size, size)).convert_alpha()
+            except Exception as e:
+                logger.error(f"Error loading logo: {e}")
+        self.logo_cache[key] = logo
+        return logo
+    
+    def _draw_selector_item(self, surface, symbol_font, coin, x, y, size, is_current):
+        """Draw a single item in the selector with logo and hover effects."""
+        logo = self._get_logo(coin['symbol'], size - 20)
+        
+        if logo:
             try:
                 # Create background for logo
                 bg_rect = pygame.Rect(x, y, size, size)
                 if is_current:
                     # Draw glow effect for current ticker
-                    glow_surface = pygame.Surface((size + 20, size + 20), pygame.SRCALPHA)
-                    for radius in range(10, 0, -2):
-                        alpha = int(60 * (radius / 10))
-                        pygame.draw.circle(glow_surface, (255, 255, 255, alpha), 
-                                        (size//2 + 10, size//2 + 10), size//2 + radius)
-                    self.display.surface.blit(glow_surface, (x - 10, y - 10))
+                    surface.blit(self._get_glow_surface(size), (x - 10, y - 10))
                 
                 # Draw subtle background for logo
-                pygame.draw.rect(self.display.surface, (30, 30, 30), bg_rect, border_radius=15)
+                surface.blit(self._get_item_background(size), bg_rect)
                 
                 # Draw logo
-                logo = pygame.image.load(logo_path)
-                logo = pygame.transform.scale(logo, (size - 20, size - 20))
                 logo_rect = logo.get_rect(center=bg_rect.center)
-                self.display.surface.blit(logo, logo_rect)
+                surface.blit(logo, logo_rect)
                 
                 # Draw symbol below logo
-                symbol_font = self.display.get_text_font('sm', 'regular')
-                symbol_surface = symbol_font.render(coin['symbol'].upper(), True, (200, 200, 200))
+                symbol_surface = self._render_text(symbol_font, coin['symbol'].upper(), (200, 200, 200))
                 symbol_rect = symbol_surface.get_rect(
                     centerx=bg_rect.centerx,
                     top=bg_rect.bottom + 8
                 )
-                self.display.surface.blit(symbol_surface, symbol_rect)
+                surface.blit(symbol_surface, symbol_rect)
                 
             except Exception as e:
                 logger.error(f"Error drawing selector item: {e}")
@@ -300,23 +370,18 @@ class TickerScreen(BaseScreen):
         # Draw regular ticker screen content
         # Draw coin logo in top right
         logo_size = 64  # Large icon size
-        logo_path = os.path.join(AppConfig.CACHE_DIR, f"{current_coin['symbol'].lower()}_logo.png")
-        if os.path.exists(logo_path):
-            try:
-                logo = pygame.image.load(logo_path)
-                logo = pygame.transform.scale(logo, (logo_size, logo_size))
-                logo_rect = logo.get_rect(
-                    right=self.width - 20,  # 20px from right edge
-                    top=20  # 20px from top
-                )
-                self.display.surface.blit(logo, logo_rect)
-            except Exception as e:
-                logger.error(f"Error loading logo: {e}")
+        logo = self._get_logo(current_coin['symbol'], logo_size)
+        if logo:
+            logo_rect = logo.get_rect(
+                right=self.width - 20,  # 20px from right edge
+                top=20  # 20px from top
+            )
+            self.display.surface.blit(logo, logo_rect)
         
         # Draw price (larger)
         price_text = f"${current_coin['current_price']:,.2f}"
         price_font = self.display.get_title_font('xl')
-        price_surface = price_font.render(price_text, True, AppConfig.WHITE)
+        price_surface = self._render_text(price_font, price_text, AppConfig.WHITE)
         price_rect = price_surface.get_rect(
             left=20,
             top=20
@@ -328,7 +393,7 @@ class TickerScreen(BaseScreen):
         change_color = AppConfig.GREEN if change_24h >= 0 else AppConfig.RED
         change_text = f"{change_24h:+.1f}%"
         change_font = self.display.get_title_font('md')
-        change_surface = change_font.render(change_text, True, change_color)
+        change_surface = self._render_text(change_font, change_text, change_color)
         change_rect = change_surface.get_rect(
             left=price_rect.right + 20,
             centery=price_rect.centery
@@ -336,11 +401,7 @@ class TickerScreen(BaseScreen):
         self.display.surface.blit(change_surface, change_rect)
         
         # Draw trend icon
-        trend_icon = self.assets.get_icon(
-            'trending-up' if change_24h >= 0 else 'trending-down',
-            size=(32, 32),
-            color=change_color
-        )
+        trend_icon = self.trend_icons[change_24h >= 0]
         if trend_icon:
             trend_rect = trend_icon.get_rect(
                 left=change_rect.right + 10,
@@ -351,7 +412,7 @@ class TickerScreen(BaseScreen):
         # Draw coin name and symbol below price (larger)
         name_text = f"{current_coin['name']}"
         name_font = self.display.get_title_font('lg', 'bold')
-        name_surface = name_font.render(name_text, True, AppConfig.WHITE)
+        name_surface = self._render_text(name_font, name_text, AppConfig.WHITE)
         name_rect = name_surface.get_rect(
             left=20,
             top=price_rect.bottom + 15
@@ -361,7 +422,7 @@ class TickerScreen(BaseScreen):
         # Draw symbol below name (larger but light weight)
         symbol_text = current_coin['symbol'].upper()
         symbol_font = self.display.get_font('light', 'title-md')
-        symbol_surface = symbol_font.render(symbol_text, True, (128, 128, 128))
+        symbol_surface = self._render_text(symbol_font, symbol_text, (128, 128, 128))
         symbol_rect = symbol_surface.get_rect(
             left=20,
             top=name_rect.bottom + 8
@@ -369,14 +430,12 @@ class TickerScreen(BaseScreen):
         self.display.surface.blit(symbol_surface, symbol_rect)
         
         # Draw star if favorited
-        if current_coin.get('favorite', False):
-            star_icon = self.assets.get_icon('star', size=(24, 24), color=(255, 165, 0))
-            if star_icon:
-                star_rect = star_icon.get_rect(
-                    left=symbol_rect.right + 10,
-                    centery=symbol_rect.centery
-                )
-                self.display.surface.blit(star_icon, star_rect)
+        if current_coin.get('favorite', False) and self.star_icon:
+            star_rect = self.star_icon.get_rect(
+                left=symbol_rect.right + 10,
+                centery=symbol_rect.centery
+            )
+            self.display.surface.blit(self.star_icon, star_rect)
         
         # Draw sparkline if price history is available
         if 'sparkline_7d' in current_coin and current_coin['sparkline_7d']:
@@ -2,11 +2,15 @@
 
 import os
 import pygame
+from concurrent.futures import ThreadPoolExecutor
 from ..config.settings import AppConfig
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Decodes and processes icons while the rest of the application starts up
+_icon_loader = ThreadPoolExecutor(max_workers=2, thread_name_prefix='icon-loader')
+
 class AssetManager:
     """Centralized manager for all application assets."""
     
@@ -22,6 +26,7 @@ class AssetManager:
         """Initialize all application assets."""
         if not hasattr(self, 'initialized'):
             self.icons = {}
+            self._icon_futures = {}
             self.fonts = {}
             self._load_icons()
             self._load_fonts()
@@ -29,10 +34,10 @@ class AssetManager:
             logger.info("AssetManager initialized")
     
     def _load_icons(self):
-        """Load all application icons."""
+        """Start loading all application icons in the background."""
         icon_names = ['star', 'edit', 'trending-up', 'trending-down', 'settings', 'news', 'stocks']
         for name in icon_names:
-            self.icons[name] = self._load_and_process_icon(name)
+            self._icon_futures[name] = _icon_loader.submit(self._load_and_process_icon, name)
     
     def _load_fonts(self):
         """Load all application fonts."""
@@ -76,8 +81,9 @@ class AssetManager:
             
         except Exception as e:
             logger.error(f"Error loading font {key}: {e}")
-            # Return a fallback font
-            return pygame.font.Font(None, AppConfig.FONT_SIZES['md'])
+            # Keep a fallback font so later lookups don't retry the load and build a new font each time
+            self.fonts[key] = pygame.font.Font(None, AppConfig.FONT_SIZES['md'])
+            return self.fonts[key]
     
     def _load_and_process_icon(self, name: str, size: tuple = (24, 24)):
         """Load and process an individual icon."""
@@ -87,12 +93,13 @@ class AssetManager:
             icon = icon.convert_alpha()
             icon = pygame.transform.scale(icon, size)
             
-            # Remove white background if present
-            white = (255, 255, 255, 255)
-            for x in range(icon.get_width()):
-                for y in range(icon.get_height()):
-                    if icon.get_at((x, y)) == white:
-                        icon.set_at((x, y), (0, 0, 0, 0))
+            # Remove white background if present, masking all opaque white pixels at once
+            rgb = pygame.surfarray.pixels3d(icon)
+            alpha = pygame.surfarray.pixels_alpha(icon)
+            white = (rgb == 255).all(axis=-1) & (alpha == 255)
+            rgb[white] = 0
+            alpha[white] = 0
+            del rgb, alpha  # Release the surface lock held by the pixel arrays
             
             logger.debug(f"Loaded icon: {name}")
             return icon
@@ -110,7 +117,11 @@ class AssetManager:
             color: Optional tuple of (r,g,b) to recolor the icon
         """
         if name not in self.icons:
-            return None
+            # Wait for the background load the first time an icon is needed
+            future = self._icon_futures.pop(name, None)
+            if future is None:
+                return None
+            self.icons[name] = future.result()
             
         icon = self.icons[name]
         if not icon:
@@ -123,13 +134,12 @@ class AssetManager:
         if size and size != icon.get_size():
             icon = pygame.transform.scale(icon, size)
         
-        # Recolor if needed
+        # Recolor if needed, tinting every non-transparent pixel at once
         if color:
-            for x in range(icon.get_width()):
-                for y in range(icon.get_height()):
-                    current_color = icon.get_at((x, y))
-                    if current_color.a > 0:  # If pixel is not transparent
-                        icon.set_at((x, y), (*color, current_color.a))
+            rgb = pygame.surfarray.pixels3d(icon)
+            alpha = pygame.surfarray.pixels_alpha(icon)
+            rgb[alpha > 0] = color[:3]
+            del rgb, alpha  # Release the surface lock held by the pixel arrays
         
         return icon
     
@@ -52,6 +52,9 @@ class CryptoManager:
             self.price_update_thread.join()
             self.price_update_thread = None
             logger.info("Stopped price update thread")
+        
+        # Make sure queued saves reach the disk before shutting down
+        self.storage.flush()
     
     def _update_prices_loop(self):
         """Background loop to update prices."""
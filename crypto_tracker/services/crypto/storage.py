@@ -2,28 +2,65 @@
 
 import json
 import os
+import threading
 from typing import List, Dict, Optional
 from ...config.settings import AppConfig
 from ...utils.logger import get_logger
 import requests
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
 logger = get_logger(__name__)
 
+def _normalize_coin(item) -> Optional[Dict]:
+    """Return a stored coin entry with its defaults filled in, or None if it is invalid."""
+    if isinstance(item, dict) and 'id' in item and 'symbol' in item:
+        item.setdefault('favorite', False)
+        return item
+    if isinstance(item, str) and item:
+        # Older versions stored a bare list of coin ids
+        return {'id': item.lower(), 'symbol': item.upper(), 'favorite': False}
+    return None
+
 class CryptoStorage:
     """Manages persistent storage of cryptocurrency data."""
     
     def __init__(self):
+        self._legacy_format = False  # Set when the file still holds bare coin ids
         self.tracked_coins = self._load_tracked_coins()
         os.makedirs(AppConfig.DATA_DIR, exist_ok=True)
         os.makedirs(AppConfig.CACHE_DIR, exist_ok=True)
+        
+        # Saves are written by a background thread, only the latest pending save is kept
+        self._pending_save = None
+        self._saved_data = None  # Encoded data last handed to the writer, used to skip no-op saves
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._save_requested = threading.Event()
+        self._save_thread = threading.Thread(target=self._save_loop)
+        self._save_thread.daemon = True
+        self._save_thread.start()
+        
+        # Rewrite a legacy file once so later loads take the plain dict path
+        if self._legacy_format:
+            logger.info("Upgrading tracked coins file from the legacy id list format")
+            self._save_tracked_coins()
         logger.info("CryptoStorage initialized")
     
     def _load_tracked_coins(self) -> List[Dict]:
         """Load tracked coins from storage."""
         try:
             if os.path.exists(AppConfig.TRACKED_COINS_FILE):
-                with open(AppConfig.TRACKED_COINS_FILE, 'r') as f:
-                    coins = json.load(f)
+                with open(AppConfig.TRACKED_COINS_FILE, 'rb') as f:
+                    data = f.read()
+                    entries = orjson.loads(data) if orjson else json.loads(data)
+                    coins = [coin for coin in map(_normalize_coin, entries) if coin is not None]
+                    self._legacy_format = any(isinstance(entry, str) for entry in entries)
+                    if len(coins) != len(entries):
+                        logger.warning(f"Skipped {len(entries) - len(coins)} invalid tracked coin entries")
                     logger.info(f"Loaded {len(coins)} tracked coins")
                     return coins
         except Exception as e:
@@ -31,13 +68,56 @@ class CryptoStorage:
         return []
     
     def _save_tracked_coins(self):
-        """Save tracked coins to storage."""
+        """Queue the tracked coins to be saved to storage."""
+        try:
+            if orjson:
+                data = orjson.dumps(self.tracked_coins, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.tracked_coins, indent=2).encode()
+        except Exception as e:
+            logger.error(f"Error saving tracked coins: {e}")
+            return
+        
+        # Replace any save the writer has not picked up yet, unless nothing changed
+        with self._pending_lock:
+            if self._pending_save is None and data == self._saved_data:
+                return
+            self._pending_save = (data, len(self.tracked_coins))
+        self._save_requested.set()
+    
+    def _save_loop(self):
+        """Background loop writing queued saves to disk."""
+        while True:
+            self._save_requested.wait()
+            self._save_requested.clear()
+            self.flush()
+    
+    def flush(self):
+        """Write any queued save to disk, waiting for a write in progress to finish."""
+        with self._write_lock:
+            with self._pending_lock:
+                pending, self._pending_save = self._pending_save, None
+                if pending:
+                    self._saved_data = pending[0]
+            if pending and not self._write_tracked_coins(*pending):
+                with self._pending_lock:
+                    self._saved_data = None  # Let the next save retry
+    
+    def _write_tracked_coins(self, data: bytes, count: int) -> bool:
+        """Write encoded tracked coins to storage, returning whether it succeeded."""
         try:
-            with open(AppConfig.TRACKED_COINS_FILE, 'w') as f:
-                json.dump(self.tracked_coins, f, indent=2)
-            logger.info(f"Saved {len(self.tracked_coins)} tracked coins")
+            # Write to a temporary file and swap it in so a crash never leaves a partial file
+            tmp_path = AppConfig.TRACKED_COINS_FILE + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, AppConfig.TRACKED_COINS_FILE)
+            logger.info(f"Saved {count} tracked coins")
+            return True
         except Exception as e:
             logger.error(f"Error saving tracked coins: {e}")
+            return False
     
     def add_coin(self, coin_data: Dict) -> bool:
         """
@@ -51,8 +131,7 @@ class CryptoStorage:
             # Check if coin already exists
             if not any(c['id'] == coin_data['id'] for c in self.tracked_coins):
                 # Add favorite status if not present
-                if 'favorite' not in coin_data:
-                    coin_data['favorite'] = False
+                coin_data.setdefault('favorite', False)
                 
                 # Cache the coin logo
                 if 'image' in coin_data:
@@ -131,7 +210,6 @@ class CryptoStorage:
             if not os.path.exists(logo_path):
                 response = requests.get(url)
                 if response.status_code == 200:
-                    os.makedirs(AppConfig.CACHE_DIR, exist_ok=True)
                     with open(logo_path, 'wb') as f:
                         f.write(response.content)
                     logger.debug(f"Cached logo for {symbol}")
@@ -43,7 +43,13 @@ class Display:
     
     def _init_display_surface(self):
         """Initialize the pygame display."""
-        self.surface = pygame.display.set_mode((AppConfig.DISPLAY_WIDTH, AppConfig.DISPLAY_HEIGHT))
+        size = (AppConfig.DISPLAY_WIDTH, AppConfig.DISPLAY_HEIGHT)
+        try:
+            # Let SDL's renderer present and scale the fixed logical resolution the screens are laid out for
+            self.surface = pygame.display.set_mode(size, pygame.SCALED | pygame.DOUBLEBUF)
+        except pygame.error as e:
+            logger.warning(f"Scaled display mode unavailable, using a plain window: {e}")
+            self.surface = pygame.display.set_mode(size)
         pygame.display.set_caption("Crypto Tracker")
         self.clock = pygame.time.Clock()
     
@@ -28,6 +28,7 @@ class NewsService:
             self.last_update = 0
             self.update_interval = 3600  # 1 hour
             self.cache_file = os.path.join(AppConfig.CACHE_DIR, 'news_cache.json')
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
             
             # Load cache first for immediate display
             self._load_cache()
@@ -69,13 +70,18 @@ class NewsService:
     def _save_cache(self) -> None:
         """Save news data to cache."""
         try:
-            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
-            with open(self.cache_file, 'w') as f:
-                json.dump({
-                    'crypto_news': self.crypto_news,
-                    'stock_news': self.stock_news,
-                    'timestamp': self.last_update
-                }, f)
+            # Encode up front so the cache is written in one call
+            data = json.dumps({
+                'crypto_news': self.crypto_news,
+                'stock_news': self.stock_news,
+                'timestamp': self.last_update
+            }).encode()
+            
+            # Write to a temporary file and swap it in so a crash never leaves a partial file
+            tmp_path = self.cache_file + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self.cache_file)
             logger.info("Saved news to cache")
         except Exception as e:
             logger.error(f"Error saving news cache: {e}")
@@ -78,8 +78,9 @@ class ScreenManager:
             # Initialize new screen with any kwargs
             self.current_screen.on_screen_enter(**kwargs)
             
-            # Force immediate draw
+            # Force immediate full draw
             self.current_screen.needs_redraw = True
+            self.current_screen.dirty_rects = []
             self.update_screen()
             
         except Exception as e:
@@ -102,9 +103,9 @@ class ScreenManager:
             
         try:
             # Let current screen handle the event
-            logger.debug(f"Forwarding event {event.type} to {self.current_screen.__class__.__name__}")
+            logger.debug("Forwarding event %s to %s", event.type, self.current_screen.__class__.__name__)
             self.current_screen.handle_event(event)
-            return True
+            return self.current_screen.needs_redraw
         except Exception as e:
             logger.error(f"Error handling event: {e}")
             return False
@@ -117,7 +118,12 @@ class ScreenManager:
         try:
             if self.current_screen.needs_redraw:
                 self.current_screen.draw()
-                pygame.display.flip()
+                # Only push the changed regions when the screen reported them
+                if self.current_screen.dirty_rects:
+                    pygame.display.update(self.current_screen.dirty_rects)
+                    self.current_screen.dirty_rects = []
+                else:
+                    pygame.display.flip()
                 self.current_screen.needs_redraw = False
         except Exception as e:
             logger.error(f"Error updating screen: {e}")
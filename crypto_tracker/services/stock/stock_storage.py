@@ -7,6 +7,11 @@ from ...config.settings import AppConfig
 from ...utils.logger import get_logger
 import requests
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
 logger = get_logger(__name__)
 
 class StockStorage:
@@ -14,6 +19,7 @@ class StockStorage:
     
     def __init__(self):
         self.tracked_stocks = self._load_tracked_stocks()
+        self._saved_data = None  # Encoded data last written, used to skip no-op saves
         os.makedirs(AppConfig.DATA_DIR, exist_ok=True)
         os.makedirs(AppConfig.CACHE_DIR, exist_ok=True)
         logger.info("StockStorage initialized")
@@ -23,8 +29,9 @@ class StockStorage:
         try:
             stocks_file = os.path.join(AppConfig.DATA_DIR, "tracked_stocks.json")
             if os.path.exists(stocks_file):
-                with open(stocks_file, 'r') as f:
-                    stocks = json.load(f)
+                with open(stocks_file, 'rb') as f:
+                    data = f.read()
+                    stocks = orjson.loads(data) if orjson else json.loads(data)
                     logger.info(f"Loaded {len(stocks)} tracked stocks")
                     return stocks
         except Exception as e:
@@ -35,8 +42,21 @@ class StockStorage:
         """Save tracked stocks to storage."""
         try:
             stocks_file = os.path.join(AppConfig.DATA_DIR, "tracked_stocks.json")
-            with open(stocks_file, 'w') as f:
-                json.dump(self.tracked_stocks, f, indent=2)
+            if orjson:
+                data = orjson.dumps(self.tracked_stocks, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.tracked_stocks, indent=2).encode()
+            if data == self._saved_data:
+                return
+            
+            # Write to a temporary file and swap it in so a crash never leaves a partial file
+            tmp_path = stocks_file + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, stocks_file)
+            self._saved_data = data
             logger.info(f"Saved {len(self.tracked_stocks)} tracked stocks")
         except Exception as e:
             logger.error(f"Error saving tracked stocks: {e}")
@@ -53,8 +73,7 @@ class StockStorage:
             # Check if stock already exists
             if not any(s['id'] == stock_data['id'] for s in self.tracked_stocks):
                 # Add favorite status if not present
-                if 'favorite' not in stock_data:
-                    stock_data['favorite'] = False
+                stock_data.setdefault('favorite', False)
                 
                 self.tracked_stocks.append(stock_data)
                 self._save_tracked_stocks()
@@ -31,7 +31,7 @@ class GestureHandler:
             self.start_x = event.x
             self.start_y = event.y
             self.press_start_time = pygame.time.get_ticks()
-            logger.debug(f"Touch start at ({self.start_x:.2f}, {self.start_y:.2f})")
+            logger.debug("Touch start at (%.2f, %.2f)", self.start_x, self.start_y)
         
         elif event.type == AppConfig.EVENT_TYPES['FINGER_UP'] and self.start_x is not None and self.start_y is not None:
             dx = event.x - self.start_x
@@ -39,14 +39,14 @@ class GestureHandler:
             
             # Calculate distance moved
             distance = (dx * dx + dy * dy) ** 0.5
-            logger.debug(f"Touch end at ({event.x:.2f}, {event.y:.2f}), distance: {distance:.2f}")
+            logger.debug("Touch end at (%.2f, %.2f), distance: %.2f", event.x, event.y, distance)
             
             # Check for long press
             if self.press_start_time is not None:
                 press_duration = pygame.time.get_ticks() - self.press_start_time
                 if press_duration >= self.LONG_PRESS_DURATION and distance < 0.05:
                     gestures['long_press'] = True
-                    logger.debug(f"Detected long press (duration={press_duration}ms)")
+                    logger.debug("Detected long press (duration=%sms)", press_duration)
             
             # Only register as swipe if moved more than 10% of screen
             if distance > 0.1:
@@ -54,17 +54,17 @@ class GestureHandler:
                 if abs(dx) > abs(dy):
                     if dx > 0:
                         gestures['swipe_right'] = True
-                        logger.debug(f"Detected swipe right (dx={dx:.2f}, dy={dy:.2f})")
+                        logger.debug("Detected swipe right (dx=%.2f, dy=%.2f)", dx, dy)
                     else:
                         gestures['swipe_left'] = True
-                        logger.debug(f"Detected swipe left (dx={dx:.2f}, dy={dy:.2f})")
+                        logger.debug("Detected swipe left (dx=%.2f, dy=%.2f)", dx, dy)
                 else:
                     if dy > 0:
                         gestures['swipe_down'] = True
-                        logger.debug(f"Detected swipe down (dx={dx:.2f}, dy={dy:.2f})")
+                        logger.debug("Detected swipe down (dx=%.2f, dy=%.2f)", dx, dy)
                     else:
                         gestures['swipe_up'] = True
-                        logger.debug(f"Detected swipe up (dx={dx:.2f}, dy={dy:.2f})")
+                        logger.debug("Detected swipe up (dx=%.2f, dy=%.2f)", dx, dy)
             else:
                 logger.debug("Touch distance too small for gesture")
             
@@ -74,6 +74,6 @@ class GestureHandler:
             self.press_start_time = None
         
         elif event.type == AppConfig.EVENT_TYPES['FINGER_MOTION']:
-            logger.debug(f"Touch motion at ({event.x:.2f}, {event.y:.2f})")
+            logger.debug("Touch motion at (%.2f, %.2f)", event.x, event.y)
         
         return gestures
\ No newline at end of file
@@ -38,6 +38,13 @@ def main():
         screen_manager = ScreenManager(display)
         service_manager.register_service('screen_manager', screen_manager)
         
+        # Touch event types forwarded to the screens
+        touch_events = frozenset((
+            AppConfig.EVENT_TYPES['FINGER_DOWN'],
+            AppConfig.EVENT_TYPES['FINGER_UP'],
+            AppConfig.EVENT_TYPES['FINGER_MOTION']
+        ))
+        
         # Main game loop
         clock = pygame.time.Clock()
         running = True
@@ -45,10 +52,20 @@ def main():
         needs_update = True
         
         while running:
+            # Sleep until an event arrives or the next periodic update is due
+            timeout = 1000 - (pygame.time.get_ticks() - last_time_update)
+            if timeout > 0:
+                event = pygame.event.wait(timeout)
+                events = pygame.event.get()
+                if event.type != pygame.NOEVENT:
+                    events.insert(0, event)
+            else:
+                # The update is already due, poll instead since wait(0) blocks until an event
+                events = pygame.event.get()
             current_time = pygame.time.get_ticks()
             
             # Handle all events
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
                     break
@@ -56,9 +73,7 @@ def main():
                     if event.key == pygame.K_q:
                         running = False
                         break
-                elif event.type in [AppConfig.EVENT_TYPES['FINGER_DOWN'], 
-                                  AppConfig.EVENT_TYPES['FINGER_UP'],
-                                  AppConfig.EVENT_TYPES['FINGER_MOTION']]:
+                elif event.type in touch_events:
                     if screen_manager.handle_event(event):
                         needs_update = True
             